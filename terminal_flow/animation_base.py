@@ -6,14 +6,40 @@ file cycling, input handling, and common state management.
 """
 
 import curses
+import re
+import sys
 import time
+from array import array
+from bisect import bisect_left
+from itertools import repeat
+from operator import itemgetter
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Tuple
 
 from .constants import ANIMATION_MODES
 from .text import TextLoader
 from .colors.curses_adapter import get_default_adapter, get_default_sequence
 
+# Tail of each frame wait that is spun instead of slept. Windows sleep can
+# overshoot by a full 1-16ms timer tick; elsewhere nanosleep is precise, so
+# no spinning (and no extra CPU) is needed.
+_SPIN_TAIL_NS = 2_000_000 if sys.platform == 'win32' else 0
+
+# Consecutive characters that modes draw (whitespace is always skipped)
+_NON_WHITESPACE_RUN = re.compile(r'\S+')
+
+
+def make_gather(indices):
+    """
+    Build a callable that picks the given indices out of a sequence as a tuple.
+
+    operator.itemgetter does the picking in C, but returns a bare item rather
+    than a tuple for a single index, so short index lists index explicitly.
+    """
+    if len(indices) > 1:
+        return itemgetter(*indices)
+    return lambda seq, picks=tuple(indices): tuple(seq[i] for i in picks)
+
 
 class BaseAnimationMode(ABC):
     """
@@ -28,6 +54,11 @@ class BaseAnimationMode(ABC):
     - Screen management
     """
 
+    # Full-cover contract: True when draw_frame rewrites every cell it touched
+    # on the previous frame (same cells, new attributes). Such modes skip the
+    # per-frame erase; file, color and resize changes still erase explicitly.
+    full_cover = False
+
     def __init__(self, mode_name: str):
         """
         Initialize base animation mode.
@@ -49,7 +80,12 @@ class BaseAnimationMode(ABC):
         self.current_color_scheme = None
         self.current_color_index = 0
         self.current_mode_index = 0
-        self.last_update_time = 0.0
+        self.last_update_ns = 0
+        self._frame_ns = 0  # Frame interval; handle_input waits out the frame in getch
+        self._auto_cycle_enabled = False
+        # True until a frame has been drawn onto a freshly erased screen; modes
+        # that only redraw changed cells must repaint everything while set
+        self.screen_wiped = True
 
         # Content state
         self.lines = []
@@ -59,16 +95,30 @@ class BaseAnimationMode(ABC):
         self.content_height = 0
         self.start_row = 0
         self.start_col = 0
+        self.char_positions = []  # Per-line char_idx / line_len fractions
+        self.visible_indices = []  # Per-line indices of non-whitespace characters
+        self.clipped_lines = []  # (line_idx, row, line, indices) for on-screen characters
 
         # Curses objects
         self.stdscr = None
         self.color_adapter = None
         self.sequence_generator = None
-        self.loader = None
+        self.loader = TextLoader("")  # Empty dir since we have file paths
+
+        # Loaded lines plus their content intrinsics, keyed by path; reused while
+        # the loader returns the same content object (i.e. the file is unchanged)
+        self._file_cache: Dict[Any, Tuple] = {}
 
         # Performance optimization: Pre-computed color palette
-        self.color_palette = []
+        self.color_palette = array('l')
         self.palette_size = 360  # High resolution color palette
+        self._palette_len_m1 = 0
+        self._palette_cache: Dict[Optional[str], array] = {}  # Scheme -> built palette
+        self._ring = []  # Palette steps repeated twice (see palette_ring)
+        self._ring_palette = None  # Palette the ring was built from
+
+        # Keycode -> handler table (built in setup_curses)
+        self._key_handlers = {}
 
     def setup_curses(self, stdscr):
         """Initialize curses settings and color adapters."""
@@ -76,8 +126,11 @@ class BaseAnimationMode(ABC):
 
         # Curses setup
         curses.curs_set(0)  # Hide cursor
-        stdscr.nodelay(True)  # Non-blocking input
-        stdscr.timeout(1)  # Minimal timeout
+        stdscr.nodelay(True)  # Non-blocking by default; handle_input sets a per-frame timeout
+        stdscr.leaveok(True)  # Don't track/restore the (hidden) cursor on each write
+
+        # Key dispatch table for handle_input
+        self._build_key_handlers()
 
         # Initialize color adapter
         self.color_adapter = get_default_adapter()
@@ -97,7 +150,6 @@ class BaseAnimationMode(ABC):
         # File cycling state
         self.current_file_index = starting_file_index
         self.last_file_change = time.time()
-        self.loader = TextLoader("")  # Empty dir since we have file paths
 
         # Color scheme cycling state
         self.current_color_scheme = color_scheme if color_scheme in self.color_schemes else None
@@ -109,120 +161,276 @@ class BaseAnimationMode(ABC):
         # Load initial file and calculate bounds
         self.load_file(text_files)
 
-        self.last_update_time = time.time()
+        self.last_update_ns = time.monotonic_ns()
 
         return True
 
     def load_file(self, text_files):
         """Load current file and calculate content bounds."""
-        current_content = self.loader.load_file(text_files[self.current_file_index])
-        self.lines = current_content.split('\n')
+        path = text_files[self.current_file_index]
+        content = self.loader.load_file(path)  # Cached by the loader until the file changes
+        cached = self._file_cache.get(path)
+        if cached is None or cached[0] is not content:
+            self.lines = content.split('\n')
+            self._compute_content_intrinsics()
+            self._file_cache[path] = (
+                content, self.lines, self.char_positions, self.visible_indices,
+                self.content_start, self.content_end, self.content_width, self.content_height,
+            )
+        else:
+            (_, self.lines, self.char_positions, self.visible_indices,
+             self.content_start, self.content_end, self.content_width, self.content_height) = cached
 
         self.calculate_content_bounds()
 
-    def calculate_content_bounds(self):
-        """Calculate content bounds and center ASCII art on screen."""
-        max_rows, max_cols = self.stdscr.getmaxyx()
+    def _compute_content_intrinsics(self):
+        """
+        Scan lines for the content extent and width of the ASCII art.
+
+        Depends only on the loaded lines, so it runs once per file (results are
+        cached by load_file) rather than on every resize or revisit.
+        """
+        # Horizontal position of each character within its own line (0.0-1.0)
+        self.char_positions = [[i / n for i in range(n)] for n in map(len, self.lines)]
+
+        # Characters that get drawn (whitespace is always skipped), so draw loops
+        # don't have to test every character on every frame
+        self.visible_indices = [[i for i, char in enumerate(line) if not char.isspace()]
+                                for line in self.lines]
 
         # Calculate the actual content bounds of ASCII art, excluding empty lines
         if not self.lines:
             self.content_start, self.content_end, self.content_width = 0, 0, 0
             self.content_height = 0
-            self.start_row = 0
-            self.start_col = 0
             return
 
-        # Find first and last non-empty lines
-        start_line = 0
-        end_line = len(self.lines) - 1
+        # Single forward pass for first/last non-empty line and content width.
+        # Blank lines only count toward the width once non-empty lines on both
+        # sides prove they sit inside the content block.
+        start_line = -1
+        end_line = -1
+        max_width = 0
+        pending_width = 0
 
         for i, line in enumerate(self.lines):
-            if line.strip():
-                start_line = i
-                break
-
-        for i in range(len(self.lines) - 1, -1, -1):
-            if self.lines[i].strip():
+            width = len(line)
+            if line and not line.isspace():
+                if start_line < 0:
+                    start_line = i
+                elif pending_width > max_width:
+                    max_width = pending_width
                 end_line = i
-                break
-
-        # Find maximum width of content
-        max_width = 0
-        for i in range(start_line, end_line + 1):
-            max_width = max(max_width, len(self.lines[i]))
+                pending_width = 0
+                if width > max_width:
+                    max_width = width
+            elif width > pending_width:
+                pending_width = width
+
+        if start_line < 0:
+            # No visible content: treat every line as content
+            start_line = 0
+            end_line = len(self.lines) - 1
+            max_width = pending_width
 
         self.content_start = start_line
         self.content_end = end_line
         self.content_width = max_width
         self.content_height = self.content_end - self.content_start + 1
+
+    def calculate_content_bounds(self):
+        """Center the cached content extent on screen (no rescan of lines)."""
+        if not self.lines:
+            self.start_row = 0
+            self.start_col = 0
+            self.clipped_lines = []
+            return
+
+        max_rows, max_cols = self.stdscr.getmaxyx()
         self.start_row = max(0, (max_rows - self.content_height) // 2) - self.content_start
         self.start_col = max(0, (max_cols - self.content_width) // 2)
 
+        # Clip the visible characters to the screen once per layout change, so
+        # draw loops iterate only in-bounds cells with no per-character checks
+        col_limit = max_cols - self.start_col
+        clipped = []
+        for line_idx, line in enumerate(self.lines):
+            row = self.start_row + line_idx
+            if row >= max_rows:
+                break
+            indices = self.visible_indices[line_idx]
+            end = bisect_left(indices, col_limit)
+            if end:
+                clipped.append((line_idx, row, line, indices[:end] if end < len(indices) else indices))
+        self.clipped_lines = clipped
+
+    def draw_runs(self, row, line, indices, attrs, shown=None):
+        """
+        Write one row's characters, one addstr per run of adjacent cells sharing an attribute.
+
+        Args:
+            row: Screen row to draw on
+            line: Source line the characters come from
+            indices: Ascending indices of the characters to draw (e.g. from clipped_lines)
+            attrs: Curses attribute for each index
+            shown: Attributes currently on screen for the same indices (the row's
+                   attrs from the previous frame), or None to write every cell.
+                   When given, runs only start at cells whose attribute changed.
+        """
+        addstr = self.stdscr.addstr
+        start_col = self.start_col
+        run_start = next_idx = run_attr = None
+        for char_idx, attr, prev in zip(indices, attrs, repeat(None) if shown is None else shown):
+            if char_idx == next_idx and attr == run_attr:
+                next_idx += 1
+                continue
+            if attr == prev:
+                continue  # Unchanged cell; the run (if any) ends here via next_idx
+            if run_start is not None:
+                try:
+                    addstr(row, start_col + run_start, line[run_start:next_idx], run_attr)
+                except curses.error:
+                    pass  # Ignore screen boundary errors
+            run_start, next_idx, run_attr = char_idx, char_idx + 1, attr
+
+        if run_start is not None:
+            try:
+                addstr(row, start_col + run_start, line[run_start:next_idx], run_attr)
+            except curses.error:
+                pass  # Ignore screen boundary errors
+
+    def compute_visible_runs(self):
+        """
+        Split the on-screen content into runs of consecutive non-whitespace characters.
+
+        Lets modes that color a whole run alike write it with one addstr call.
+
+        Returns:
+            List of (row, col, text) tuples, clipped to the current screen size
+        """
+        max_rows, max_cols = self.stdscr.getmaxyx()
+        runs = []
+        for line_idx, line in enumerate(self.lines):
+            row = self.start_row + line_idx
+            if row >= max_rows:
+                break
+
+            for match in _NON_WHITESPACE_RUN.finditer(line):
+                col = self.start_col + match.start()
+                if col >= max_cols:
+                    break
+                runs.append((row, col, match.group()[:max_cols - col]))
+
+        return runs
+
+    def _build_key_handlers(self):
+        """Build the keycode -> handler dispatch table used by handle_input."""
+        self._key_handlers = {
+            curses.KEY_RESIZE: self._on_resize_key,
+            ord('q'): self._on_exit_key,
+            ord('Q'): self._on_exit_key,
+            27: self._on_exit_key,  # ESC
+            curses.KEY_RIGHT: self._on_next_file_key,
+            curses.KEY_LEFT: self._on_prev_file_key,
+            ord('c'): self._on_color_key,
+            ord('C'): self._on_color_key,
+            ord('m'): self._on_mode_key,
+            ord('M'): self._on_mode_key,
+        }
+
     def handle_input(self, text_files) -> Optional[Dict[str, Any]]:
         """
         Handle common input events.
 
+        Waits in getch (blocking in C, GIL released) until a key arrives or the
+        next frame is due, so keys take effect immediately rather than after the
+        frame sleep. control_frame_rate then covers the sub-millisecond rest.
+
         Returns:
             Dict with mode switch info if mode switch requested, None otherwise
         """
+        remaining_ms = (self.last_update_ns + self._frame_ns - time.monotonic_ns()) // 1_000_000
+        self.stdscr.timeout(remaining_ms if remaining_ms > 0 else 0)
         key = self.stdscr.getch()
+        if key == -1:  # No key pressed (the common case in non-blocking mode)
+            return None
+
+        handler = self._key_handlers.get(key)
+        return handler(text_files) if handler else None
 
-        if key == curses.KEY_RESIZE:
-            self.calculate_content_bounds()
-            self.on_resize()
-            self.stdscr.clear()
-
-        elif key == ord('q') or key == ord('Q') or key == 27:  # ESC
-            return {}  # Signal exit
-
-        elif key == curses.KEY_RIGHT:  # Next file manually
-            self.current_file_index = (self.current_file_index + 1) % len(text_files)
-            self.load_file(text_files)
-            self.on_file_change()
-            self.last_file_change = time.time()
-            self.stdscr.clear()
-
-        elif key == curses.KEY_LEFT:  # Previous file manually
-            self.current_file_index = (self.current_file_index - 1) % len(text_files)
-            self.load_file(text_files)
-            self.on_file_change()
-            self.last_file_change = time.time()
-            self.stdscr.clear()
-
-        elif key == ord('c') or key == ord('C'):  # Cycle color schemes
-            self.current_color_index = (self.current_color_index + 1) % len(self.color_schemes)
-            self.current_color_scheme = self.color_schemes[self.current_color_index]
-            self.on_color_change()
-            self.stdscr.clear()
-
-        elif key == ord('m') or key == ord('M'):  # Switch animation mode
-            self.current_mode_index = (self.current_mode_index + 1) % len(self.modes)
-            next_mode = self.modes[self.current_mode_index]
-            return {
-                'next_mode': next_mode,
-                'current_file_index': self.current_file_index,
-                'current_color_scheme': self.current_color_scheme
-            }
-
-        return None
+    def _on_resize_key(self, text_files):
+        """Recenter content after a terminal resize."""
+        self.calculate_content_bounds()
+        self.on_resize()
+        self.stdscr.erase()
+        self.screen_wiped = True
+
+    def _on_exit_key(self, text_files):
+        """Signal exit (q, Q or ESC)."""
+        return {}
+
+    def _step_file(self, text_files, step):
+        """Move step files through the list and reload content and layout."""
+        self.current_file_index = (self.current_file_index + step) % len(text_files)
+        self.load_file(text_files)
+        self.on_file_change()
+        self.screen_wiped = True
+
+    def _on_next_file_key(self, text_files):
+        """Advance to the next file manually."""
+        self._step_file(text_files, 1)
+        self.last_file_change = time.time()
+        self.stdscr.erase()
+
+    def _on_prev_file_key(self, text_files):
+        """Go back to the previous file manually."""
+        self._step_file(text_files, -1)
+        self.last_file_change = time.time()
+        self.stdscr.erase()
+
+    def _on_color_key(self, text_files):
+        """Cycle to the next color scheme."""
+        self.current_color_index = (self.current_color_index + 1) % len(self.color_schemes)
+        self.current_color_scheme = self.color_schemes[self.current_color_index]
+        self.on_color_change()
+        # Same cells, new colors: a forced full repaint overwrites every one of
+        # them, so there is nothing stale to erase first
+        self.screen_wiped = True
+
+    def _on_mode_key(self, text_files):
+        """Request a switch to the next animation mode."""
+        self.current_mode_index = (self.current_mode_index + 1) % len(self.modes)
+        next_mode = self.modes[self.current_mode_index]
+        return {
+            'next_mode': next_mode,
+            'current_file_index': self.current_file_index,
+            'current_color_scheme': self.current_color_scheme
+        }
 
     def check_auto_file_cycling(self, text_files, cycle_interval):
         """Handle automatic file cycling if enabled."""
+        if not self._auto_cycle_enabled:
+            return  # Common case: cycling off or a single file, skip the clock read
+
         current_time = time.time()
-        if cycle_interval > 0 and current_time - self.last_file_change >= cycle_interval and len(text_files) > 1:
-            self.current_file_index = (self.current_file_index + 1) % len(text_files)
-            self.load_file(text_files)
-            self.on_file_change()
+        if current_time - self.last_file_change >= cycle_interval:
+            self._step_file(text_files, 1)
             self.last_file_change = current_time
-            self.stdscr.clear()
+            # erase, not clear: clear() makes the next refresh repaint the whole
+            # terminal, while erase lets curses send only the cells that changed
+            self.stdscr.erase()
 
     def control_frame_rate(self, update_interval):
-        """Control frame rate timing."""
-        current_time = time.time()
-        delta_time = current_time - self.last_update_time
-        if delta_time < update_interval:
-            time.sleep(update_interval - delta_time)
-        self.last_update_time = time.time()
+        """Control frame rate timing on the monotonic clock (immune to wall-clock jumps)."""
+        deadline_ns = self.last_update_ns + int(update_interval * 1_000_000_000)
+        remaining_ns = deadline_ns - time.monotonic_ns()
+
+        # Sleep for the bulk of the wait, then spin through the short tail
+        if remaining_ns > _SPIN_TAIL_NS:
+            time.sleep((remaining_ns - _SPIN_TAIL_NS) / 1_000_000_000)
+        while time.monotonic_ns() < deadline_ns:
+            pass
+
+        self.last_update_ns = time.monotonic_ns()
 
     def refresh_screen(self):
         """Refresh screen with double buffering."""
@@ -232,12 +440,13 @@ class BaseAnimationMode(ABC):
     def clear_screen(self):
         """Clear screen (erase is gentler than clear)."""
         self.stdscr.erase()
+        self.screen_wiped = True
 
     # Abstract methods that each animation mode must implement
 
     @abstractmethod
     def initialize_mode_variables(self):
-        """Initialize mode-specific variables (e.g., animation_offset, rotation_angle)."""
+        """Initialize mode-specific variables (e.g., animation_offset, rotation_pos)."""
         pass
 
     @abstractmethod
@@ -269,21 +478,43 @@ class BaseAnimationMode(ABC):
         if not self.sequence_generator:
             return
 
-        # Generate high-resolution color palette
-        color_attrs = self.sequence_generator.generate_sequence(
-            self.palette_size,
-            offset=0.0,
-            bold=True,
-            color_scheme=self.current_color_scheme
-        )
-        self.color_palette = color_attrs
+        # Palettes only depend on the scheme (10 of them), so reuse earlier builds
+        palette = self._palette_cache.get(self.current_color_scheme)
+        if palette is None:
+            # Generate high-resolution color palette
+            color_attrs = self.sequence_generator.generate_sequence(
+                self.palette_size,
+                offset=0.0,
+                bold=True,
+                color_scheme=self.current_color_scheme
+            )
+            # Packed C-long LUT of fully composed attributes (pair | A_BOLD)
+            palette = array('l', color_attrs)
+            self._palette_cache[self.current_color_scheme] = palette
+
+        self.color_palette = palette
+        self._palette_len_m1 = len(palette) - 1
+
+    def palette_ring(self):
+        """
+        Get the palette's steps repeated twice, for integer-step color lookup.
+
+        Modes that quantize color positions to palette steps add a per-frame
+        tick to each character's base step; with the ring doubled, base + tick
+        never needs a modulo, and slicing ring[tick:tick + steps] rotates it.
+        """
+        palette = self.color_palette
+        if self._ring_palette is not palette:
+            self._ring = list(palette[:self.palette_size - 1]) * 2
+            self._ring_palette = palette
+        return self._ring
 
     def get_color_from_palette(self, position: float) -> int:
         """
         Get color attribute from pre-computed palette.
 
         Args:
-            position: Color position from 0.0 to 1.0
+            position: Color position from 0.0 to 1.0 (callers normalize with % 1.0)
 
         Returns:
             Curses color attribute
@@ -291,9 +522,8 @@ class BaseAnimationMode(ABC):
         if not self.color_palette:
             return 1  # curses.A_BOLD fallback
 
-        # Map position to palette index
-        index = int(position * (len(self.color_palette) - 1)) % len(self.color_palette)
-        return self.color_palette[index]
+        # Map position straight to palette index (position is already in [0, 1))
+        return self.color_palette[int(position * self._palette_len_m1)]
 
     # Main animation loop
 
@@ -320,6 +550,13 @@ class BaseAnimationMode(ABC):
         if not self.setup_state(text_files, color_scheme, starting_file_index):
             return None
 
+        # Loop-invariant: auto cycling only matters with a positive interval and 2+ files
+        self._auto_cycle_enabled = cycle_interval > 0 and len(text_files) > 1
+        self._frame_ns = int(update_interval * 1_000_000_000)
+
+        # Mode instances are reused across mode switches, and the mode that ran
+        # in between repainted the screen: nothing drawn before is still shown
+        self.screen_wiped = True
         self.initialize_mode_variables()
 
         # Main animation loop
@@ -346,9 +583,11 @@ class BaseAnimationMode(ABC):
             # Update animation state
             self.update_animation_state(animation_speed, update_interval)
 
-            # Clear and draw frame
-            self.clear_screen()
+            # Clear (only when the mode may leave stale cells) and draw frame
+            if not self.full_cover:
+                self.clear_screen()
             self.draw_frame()
+            self.screen_wiped = False
             self.refresh_screen()
 
         return None
\ No newline at end of file
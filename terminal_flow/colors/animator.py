@@ -7,17 +7,81 @@ Pure curses implementation without external dependencies.
 """
 
 import time
-from typing import List, Dict, Tuple, Optional, Union, Callable
+from collections import OrderedDict
+from itertools import chain
+from typing import List, Dict, Tuple, Optional, Union, Hashable
 
 from .schemes import BaseColorScheme
 
+# Cache keys are plain tuples: hashed in C with no string formatting on lookup
+CacheKey = Tuple[Hashable, ...]
+
+# One animation frame as contiguous RGB bytes (r0 g0 b0 r1 g1 b1 ...): 3 bytes
+# per character instead of a tuple object plus three int references
+PackedFrame = bytes
+
+
+def _pack_rgb_sequence(colors: List[Tuple[int, int, int]]) -> PackedFrame:
+    """
+    Pack a sequence of RGB tuples into one contiguous bytes buffer.
+
+    Args:
+        colors: List of RGB color tuples
+
+    Returns:
+        Packed frame with three bytes per color
+    """
+    return bytes(chain.from_iterable(colors))
+
+
+def _unpack_rgb_frame(frame: PackedFrame) -> List[Tuple[int, int, int]]:
+    """
+    Unpack a packed frame back into RGB tuples.
+
+    Args:
+        frame: Packed frame from _pack_rgb_sequence()
+
+    Returns:
+        List of RGB color tuples
+    """
+    return list(zip(frame[0::3], frame[1::3], frame[2::3]))
+
+
+def _packed_frame_to_hex(frame: PackedFrame) -> List[str]:
+    """
+    Convert a packed frame to hex strings with a single hex-encode call.
+
+    Args:
+        frame: Packed frame from _pack_rgb_sequence()
+
+    Returns:
+        List of hex color strings (e.g., "#ff0000")
+    """
+    digits = frame.hex()
+    return ['#' + digits[i:i + 6] for i in range(0, len(digits), 6)]
+
+
+def _rgb_sequence_to_hex(colors: List[Tuple[int, int, int]]) -> List[str]:
+    """
+    Convert a sequence of RGB tuples to hex strings in one pass.
+
+    Args:
+        colors: List of RGB color tuples
+
+    Returns:
+        List of hex color strings (e.g., "#ff0000")
+    """
+    return _packed_frame_to_hex(_pack_rgb_sequence(colors))
+
 
 class ColorFrameCache:
     """
     High-performance color frame caching system.
 
     Caches pre-calculated color sequences to minimize computation overhead
-    during real-time animation. Uses LRU-style eviction for memory management.
+    during real-time animation. Each frame is stored as one packed bytes
+    object (3 bytes per character), keyed by a plain tuple, and entries are
+    evicted in LRU order for memory management.
     """
 
     def __init__(self, max_cache_size: int = 100):
@@ -28,11 +92,11 @@ class ColorFrameCache:
             max_cache_size: Maximum number of cached frame sequences
         """
         self.max_cache_size = max_cache_size
-        self._cache: Dict[str, List[List[Tuple[int, int, int]]]] = {}
-        self._access_times: Dict[str, float] = {}
+        # Insertion order doubles as recency order: oldest entry sits at the front
+        self._cache: OrderedDict[CacheKey, List[PackedFrame]] = OrderedDict()
 
     def get_cache_key(self, scheme_id: str, text_length: int, frame_count: int,
-                     speed: float, **kwargs) -> str:
+                     speed: float, extra: CacheKey = ()) -> CacheKey:
         """
         Generate cache key for color sequence.
 
@@ -41,15 +105,14 @@ class ColorFrameCache:
             text_length: Number of characters in text
             frame_count: Number of animation frames
             speed: Animation speed multiplier
-            **kwargs: Additional parameters for cache key
+            extra: Optional pre-built (ordered) tuple of additional key parameters
 
         Returns:
-            Unique cache key string
+            Hashable cache key tuple
         """
-        extra_params = "_".join(f"{k}={v}" for k, v in sorted(kwargs.items()))
-        return f"{scheme_id}_{text_length}_{frame_count}_{speed}_{extra_params}"
+        return (scheme_id, text_length, frame_count, speed, extra)
 
-    def get_frames(self, cache_key: str) -> Optional[List[List[Tuple[int, int, int]]]]:
+    def get_frames(self, cache_key: CacheKey) -> Optional[List[PackedFrame]]:
         """
         Retrieve cached color frames.
 
@@ -59,39 +122,29 @@ class ColorFrameCache:
         Returns:
             Cached color frame sequence or None if not found
         """
-        if cache_key in self._cache:
-            self._access_times[cache_key] = time.time()
-            return self._cache[cache_key]
-        return None
+        frames = self._cache.get(cache_key)
+        if frames is not None:
+            self._cache.move_to_end(cache_key)
+        return frames
 
-    def store_frames(self, cache_key: str, frames: List[List[Tuple[int, int, int]]]) -> None:
+    def store_frames(self, cache_key: CacheKey, frames: List[PackedFrame]) -> None:
         """
         Store color frames in cache.
 
         Args:
             cache_key: Cache key from get_cache_key()
-            frames: List of color frame sequences to cache
+            frames: List of packed frames (see _pack_rgb_sequence) to cache
         """
-        # Evict oldest entries if cache is full
-        if len(self._cache) >= self.max_cache_size:
-            self._evict_oldest()
-
         self._cache[cache_key] = frames
-        self._access_times[cache_key] = time.time()
-
-    def _evict_oldest(self) -> None:
-        """Remove least recently used cache entry."""
-        if not self._access_times:
-            return
+        self._cache.move_to_end(cache_key)
 
-        oldest_key = min(self._access_times.keys(), key=lambda k: self._access_times[k])
-        del self._cache[oldest_key]
-        del self._access_times[oldest_key]
+        # Evict least recently used entries if cache is over capacity
+        while len(self._cache) > self.max_cache_size:
+            self._cache.popitem(last=False)
 
     def clear(self) -> None:
         """Clear all cached frames."""
         self._cache.clear()
-        self._access_times.clear()
 
     def get_cache_stats(self) -> Dict[str, int]:
         """
@@ -129,21 +182,23 @@ class ColorAnimator:
         self.color_scheme = color_scheme
         self.fps = fps
         self.frame_duration = 1.0 / fps
+        self._frame_duration_ns = 1_000_000_000 // fps
         self.enable_cache = enable_cache
 
         # Performance optimization components
         self._cache = ColorFrameCache(cache_size) if enable_cache else None
-        self._current_frames: Optional[List[List[Tuple[int, int, int]]]] = None
+        self._current_frames: Optional[List[PackedFrame]] = None
         self._frame_index = 0
-        self._last_frame_time = 0.0
+        self._last_frame_ns = 0
         self._animation_speed = 1.0
+        self._frames_stale = False  # Set by set_animation_speed, cleared on regeneration
 
         # Pre-calculation settings
         self._pre_calc_duration = 2.0  # Pre-calculate 2 seconds of animation
         self._text_length = 0
 
     def pre_calculate_frames(self, text_length: int, animation_speed: float = 1.0,
-                           duration: Optional[float] = None) -> List[List[Tuple[int, int, int]]]:
+                           duration: Optional[float] = None) -> List[PackedFrame]:
         """
         Pre-calculate color animation frames for optimal performance.
 
@@ -156,36 +211,29 @@ class ColorAnimator:
             duration: Duration in seconds to pre-calculate (default: 2.0 seconds)
 
         Returns:
-            List of color frame sequences, each containing colors for all characters
+            List of packed frames, each holding RGB bytes for all characters
         """
         if duration is None:
             duration = self._pre_calc_duration
 
         frame_count = int(duration * self.fps)
-        frames = []
 
         # Check cache first
         cache_key = None
         if self._cache:
             cache_key = self._cache.get_cache_key(
-                scheme_id=self.color_scheme.__class__.__name__,
-                text_length=text_length,
-                frame_count=frame_count,
-                speed=animation_speed
-            )
+                self.color_scheme.__class__.__name__, text_length, frame_count, animation_speed)
             cached_frames = self._cache.get_frames(cache_key)
             if cached_frames:
                 return cached_frames
 
-        # Generate frames
-        for frame_idx in range(frame_count):
-            # Calculate animation offset for this frame
-            time_offset = (frame_idx / self.fps) * animation_speed
-            animation_offset = (time_offset * 0.5) % 1.0  # 0.5 = rotation speed factor
-
-            # Generate colors for this frame
-            frame_colors = self.color_scheme.get_colors_for_text(text_length, animation_offset)
-            frames.append(frame_colors)
+        # Generate frames: per-frame offsets are computed up front so the loop body
+        # is a single bound-method call per frame (0.5 = rotation speed factor);
+        # schemes hand back packed bytes directly, no tuple list per frame
+        offset_step = animation_speed * 0.5 / self.fps
+        get_packed = self.color_scheme.get_colors_packed
+        frames = [get_packed(text_length, (frame_idx * offset_step) % 1.0)
+                  for frame_idx in range(frame_count)]
 
         # Cache the generated frames
         if self._cache and cache_key:
@@ -204,8 +252,9 @@ class ColorAnimator:
         self._text_length = text_length
         self._animation_speed = animation_speed
         self._current_frames = self.pre_calculate_frames(text_length, animation_speed)
+        self._frames_stale = False
         self._frame_index = 0
-        self._last_frame_time = time.time()
+        self._last_frame_ns = time.monotonic_ns()
 
     def get_current_frame_colors(self) -> Optional[List[Tuple[int, int, int]]]:
         """
@@ -214,6 +263,20 @@ class ColorAnimator:
         Returns:
             List of colors for current frame, or None if not initialized
         """
+        frame = self.get_current_frame_packed()
+        if frame is None:
+            return None
+
+        return _unpack_rgb_frame(frame)
+
+    def get_current_frame_packed(self) -> Optional[PackedFrame]:
+        """
+        Get the current animation frame as packed RGB bytes (no per-color objects).
+
+        Returns:
+            Packed frame for current frame, or None if not initialized
+        """
+        self._refresh_stale_frames()
         if not self._current_frames:
             return None
 
@@ -229,15 +292,15 @@ class ColorAnimator:
         Returns:
             True if frame was advanced, False otherwise
         """
+        self._refresh_stale_frames()
         if not self._current_frames:
             return False
 
-        current_time = time.time()
-        time_elapsed = current_time - self._last_frame_time
+        now_ns = time.monotonic_ns()
 
-        if force or time_elapsed >= self.frame_duration:
+        if force or now_ns - self._last_frame_ns >= self._frame_duration_ns:
             self._frame_index = (self._frame_index + 1) % len(self._current_frames)
-            self._last_frame_time = current_time
+            self._last_frame_ns = now_ns
             return True
 
         return False
@@ -249,12 +312,11 @@ class ColorAnimator:
         Returns:
             List of hex color strings for current frame, or None if not initialized
         """
-        from .generator import ColorGenerator
-        frame_colors = self.get_current_frame_colors()
-        if not frame_colors:
+        frame = self.get_current_frame_packed()
+        if not frame:
             return None
 
-        return [ColorGenerator.rgb_to_hex(color) for color in frame_colors]
+        return _packed_frame_to_hex(frame)
 
     def animate_frame_auto(self) -> bool:
         """
@@ -269,16 +331,25 @@ class ColorAnimator:
 
     def set_animation_speed(self, speed: float) -> None:
         """
-        Update animation speed and regenerate frames if needed.
+        Update animation speed and mark frames for regeneration if needed.
 
         Args:
             speed: New animation speed multiplier
         """
         if speed != self._animation_speed and self._text_length > 0:
             self._animation_speed = speed
-            # Regenerate frames with new speed
-            self._current_frames = self.pre_calculate_frames(self._text_length, speed)
-            self._frame_index = 0
+            # Invalidate only: frames are rebuilt on the next frame access, so a
+            # burst of speed changes costs a single regeneration
+            self._frames_stale = True
+
+    def _refresh_stale_frames(self) -> None:
+        """Regenerate frames for the current speed if a speed change invalidated them."""
+        if not self._frames_stale:
+            return
+
+        self._frames_stale = False
+        self._current_frames = self.pre_calculate_frames(self._text_length, self._animation_speed)
+        self._frame_index = 0
 
     def get_performance_stats(self) -> Dict[str, Union[int, float]]:
         """
@@ -327,8 +398,7 @@ class BatchColorApplicator:
         Returns:
             List of hex color strings ready for terminal styling
         """
-        from .generator import ColorGenerator
-        return [ColorGenerator.rgb_to_hex(color) for color in colors]
+        return _rgb_sequence_to_hex(colors)
 
     @staticmethod
     def prepare_color_map_hex(color_map: Dict[int, Tuple[int, int, int]]) -> Dict[int, str]:
@@ -341,5 +411,4 @@ class BatchColorApplicator:
         Returns:
             Dictionary mapping character positions to hex color strings
         """
-        from .generator import ColorGenerator
-        return {pos: ColorGenerator.rgb_to_hex(color) for pos, color in color_map.items()}
\ No newline at end of file
+        return dict(zip(color_map.keys(), _rgb_sequence_to_hex(list(color_map.values()))))
\ No newline at end of file
@@ -5,16 +5,23 @@ Provides configuration loading, validation, and color scheme creation
 for pure curses implementation with comprehensive error handling.
 """
 
-import json
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Union, Optional, Any
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 
 from .schemes import BaseColorScheme, PrismColors, CustomColors, create_color_scheme
 
+# Scheme types accepted by ColorConfig (built once, not per validate() call)
+_VALID_SCHEMES = ("prism", "custom")
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ColorConfig:
     """
     Color configuration data structure.
@@ -44,11 +51,25 @@ class ColorConfig:
             ValueError: If any configuration value is invalid
         """
         # Validate scheme type
-        valid_schemes = ["prism", "custom"]
-        if self.scheme_type not in valid_schemes:
-            raise ValueError(f"Invalid scheme_type '{self.scheme_type}'. Must be one of: {valid_schemes}")
+        if self.scheme_type not in _VALID_SCHEMES:
+            raise ValueError(f"Invalid scheme_type '{self.scheme_type}'. Must be one of: {list(_VALID_SCHEMES)}")
+
+        # Validate numeric ranges: one chained test for the common all-valid
+        # case, falling back to individual checks only to report the failure
+        if not (0.0 <= self.saturation <= 1.0 and 0.0 <= self.value <= 1.0
+                and self.animation_speed > 0.0 and self.fps > 0 and self.cache_size >= 1):
+            self._raise_range_error()
+
+        # Validate custom scheme requirements
+        if self.scheme_type == "custom":
+            if not self.colors and not self.custom_schemes:
+                raise ValueError("Custom scheme requires either 'colors' or 'custom_schemes' to be specified")
 
-        # Validate numeric ranges
+            if self.colors and len(self.colors) < 2:
+                raise ValueError("Custom scheme colors must have at least 2 colors")
+
+    def _raise_range_error(self) -> None:
+        """Raise a ValueError naming the first out-of-range numeric field."""
         if not 0.0 <= self.saturation <= 1.0:
             raise ValueError(f"saturation must be 0.0-1.0, got {self.saturation}")
 
@@ -64,13 +85,22 @@ class ColorConfig:
         if self.cache_size < 1:
             raise ValueError(f"cache_size must be at least 1, got {self.cache_size}")
 
-        # Validate custom scheme requirements
-        if self.scheme_type == "custom":
-            if not self.colors and not self.custom_schemes:
-                raise ValueError("Custom scheme requires either 'colors' or 'custom_schemes' to be specified")
 
-            if self.colors and len(self.colors) < 2:
-                raise ValueError("Custom scheme colors must have at least 2 colors")
+# Field names and default values, computed once for merge_configs
+_FIELD_NAMES = tuple(f.name for f in fields(ColorConfig))
+_DEFAULTS = {name: getattr(ColorConfig(), name) for name in _FIELD_NAMES}
+
+
+# Scheme instances are immutable in practice, so identical construction
+# arguments can share one instance instead of rebuilding it per load
+@lru_cache(maxsize=32)
+def _make_prism(saturation: float, value: float) -> PrismColors:
+    return PrismColors(saturation=saturation, value=value)
+
+
+@lru_cache(maxsize=32)
+def _make_custom(colors: Tuple[Union[str, Tuple[int, int, int]], ...]) -> CustomColors:
+    return CustomColors(list(colors))
 
 
 class ColorSchemeLoader:
@@ -84,6 +114,8 @@ class ColorSchemeLoader:
     def __init__(self):
         """Initialize color scheme loader."""
         self.default_config = ColorConfig()
+        # Parsed file configs: path -> (st_mtime_ns, config); reloaded when the file changes
+        self._file_cache: Dict[str, Tuple[int, ColorConfig]] = {}
 
     def load_from_cli(self, colors: str = "prism", speed: float = 1.0, **kwargs) -> ColorConfig:
         """
@@ -116,27 +148,41 @@ class ColorSchemeLoader:
             config_path: Path to JSON configuration file
 
         Returns:
-            ColorConfig instance loaded from file
+            ColorConfig instance loaded from file (cached until the file's
+            mtime changes; treat it as read-only)
 
         Raises:
             FileNotFoundError: If configuration file doesn't exist
             ValueError: If configuration file is invalid
         """
-        config_path = Path(config_path)
+        # Plain string key: no Path object is built on the cached fast path
+        config_path = os.fspath(config_path)
+
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+        cached = self._file_cache.get(config_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
 
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        import json  # Deferred: only needed when a config file is actually used
 
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            # One bulk read, decoded as strict UTF-8 like the old text-mode read:
+            # json.loads on raw bytes would also accept a BOM or UTF-16/32
+            with open(config_path, 'rb') as f:
+                config_data = json.loads(f.read().decode('utf-8'))
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in configuration file {config_path}: {e}")
 
         # Extract color-specific configuration
         color_config = config_data.get("colors", {})
 
-        return ColorConfig(**color_config)
+        config = ColorConfig(**color_config)
+        self._file_cache[config_path] = (mtime_ns, config)
+        return config
 
     def merge_configs(self, base_config: ColorConfig, override_config: ColorConfig) -> ColorConfig:
         """
@@ -149,22 +195,16 @@ class ColorSchemeLoader:
         Returns:
             Merged ColorConfig instance
         """
-        merged_dict = {}
-
-        # Start with base config
-        for field_name in base_config.__dataclass_fields__:
-            merged_dict[field_name] = getattr(base_config, field_name)
-
-        # Override with non-default values from override config
-        for field_name in override_config.__dataclass_fields__:
+        # Only override if the value is different from default
+        overrides = {}
+        for field_name in _FIELD_NAMES:
             override_value = getattr(override_config, field_name)
-            default_value = getattr(self.default_config, field_name)
-
-            # Only override if the value is different from default
-            if override_value != default_value:
-                merged_dict[field_name] = override_value
+            if override_value != _DEFAULTS[field_name]:
+                overrides[field_name] = override_value
 
-        return ColorConfig(**merged_dict)
+        # replace() still runs __post_init__: a merge of two valid configs can
+        # itself be invalid (e.g. custom scheme from one, colors from the other)
+        return replace(base_config, **overrides)
 
     def create_color_scheme(self, config: ColorConfig) -> BaseColorScheme:
         """
@@ -180,17 +220,22 @@ class ColorSchemeLoader:
             ValueError: If color scheme cannot be created from configuration
         """
         if config.scheme_type == "prism":
-            return PrismColors(
-                saturation=config.saturation,
-                value=config.value
-            )
+            return _make_prism(config.saturation, config.value)
 
         elif config.scheme_type == "custom":
             colors = config.colors
             if not colors:
                 raise ValueError("Custom color scheme requires colors to be specified")
 
-            return CustomColors(colors)
+            # Hashable key; JSON configs deliver RGB triples as lists
+            key = tuple(tuple(c) if isinstance(c, list) else c for c in colors)
+            try:
+                hash(key)
+            except TypeError:
+                # Entries that can't be a cache key (e.g. a JSON object) are
+                # invalid anyway; build uncached so CustomColors rejects them
+                return CustomColors(list(colors))
+            return _make_custom(key)
 
         else:
             raise ValueError(f"Unsupported scheme type: {config.scheme_type}")
@@ -232,6 +277,34 @@ class ColorSchemeLoader:
         return color_scheme, final_config
 
 
+def _split_color_list(colors_input: str) -> List[str]:
+    """
+    Split a comma-separated color list in one pass, keeping RGB tuples intact.
+
+    Commas inside parentheses belong to an RGB tuple like "(255,0,0)" and do
+    not end a token.
+
+    Args:
+        colors_input: Color specification such as "#ff0000,(0,255,0),blue"
+
+    Returns:
+        List of stripped color tokens
+    """
+    tokens = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(colors_input):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            tokens.append(colors_input[start:i].strip())
+            start = i + 1
+    tokens.append(colors_input[start:].strip())
+    return tokens
+
+
 def parse_custom_colors(colors_input: Union[str, List[str]]) -> List[Union[str, Tuple[int, int, int]]]:
     """
     Parse custom colors from various input formats.
@@ -248,11 +321,8 @@ def parse_custom_colors(colors_input: Union[str, List[str]]) -> List[Union[str,
         ValueError: If color format is invalid
     """
     if isinstance(colors_input, str):
-        # Handle comma-separated color list
-        if ',' in colors_input:
-            color_strings = [c.strip() for c in colors_input.split(',')]
-        else:
-            color_strings = [colors_input.strip()]
+        # Handle comma-separated color list (commas inside RGB tuples don't split)
+        color_strings = _split_color_list(colors_input)
     else:
         color_strings = colors_input
 
@@ -6,11 +6,74 @@ with optimized caching and terminal compatibility.
 """
 
 import curses
-import time
-from typing import Dict, Tuple, List
+from functools import lru_cache
+from typing import Dict, Tuple, List, Optional
 from .generator import ColorGenerator
 
 
+# Standard curses colors approximated as RGB, in color pair order (pair = index + 1)
+STANDARD_COLORS: Tuple[Tuple[int, int, int], ...] = (
+    (255, 0, 0),      # Red
+    (255, 255, 0),    # Yellow
+    (0, 255, 0),      # Green
+    (0, 255, 255),    # Cyan
+    (0, 0, 255),      # Blue
+    (255, 0, 255),    # Magenta
+    (255, 255, 255),  # White
+    (128, 128, 128),  # Gray
+)
+
+# Curses foreground colors for the 8-color fallback pairs (same order as STANDARD_COLORS)
+CURSES_COLORS: Tuple[int, ...] = (
+    curses.COLOR_RED,
+    curses.COLOR_YELLOW,
+    curses.COLOR_GREEN,
+    curses.COLOR_CYAN,
+    curses.COLOR_BLUE,
+    curses.COLOR_MAGENTA,
+    curses.COLOR_WHITE,
+    curses.COLOR_WHITE,  # Fallback for gray
+)
+
+
+# Per-channel lookup tables for the 6x6x6 color cube (colors 16-231), with the
+# cube weights and base offset folded in: pair = _CUBE_R[r] + _CUBE_G[g] + _CUBE_B[b]
+_CUBE_R = bytes(16 + 36 * (c * 6 >> 8) for c in range(256))
+_CUBE_G = bytes(6 * (c * 6 >> 8) for c in range(256))
+_CUBE_B = bytes(c * 6 >> 8 for c in range(256))
+
+
+def _rgb_to_pair_256(r: int, g: int, b: int, max_pairs: int) -> int:
+    """Map RGB onto the 6x6x6 color cube (colors 16-231) of a 256-color terminal."""
+    color_256 = _CUBE_R[r] + _CUBE_G[g] + _CUBE_B[b]
+    if max_pairs <= 231:
+        return min(color_256, max_pairs - 1)  # Only reachable with few color pairs
+    return color_256
+
+
+def _rgb_dist_sq(rgb1: Tuple[int, int, int], rgb2: Tuple[int, int, int]) -> int:
+    """Squared Euclidean RGB distance (same ordering as the true distance, no sqrt)."""
+    r1, g1, b1 = rgb1
+    r2, g2, b2 = rgb2
+    return (r1 - r2) * (r1 - r2) + (g1 - g2) * (g1 - g2) + (b1 - b2) * (b1 - b2)
+
+
+@lru_cache(maxsize=512)
+def _rgb_to_pair_8(r: int, g: int, b: int) -> int:
+    """Map RGB to the closest standard color pair (1-8) of an 8-color terminal."""
+    rgb = (r, g, b)
+    min_distance = 1 << 20  # Larger than any squared RGB distance (max 195075)
+    closest_index = 0
+
+    for i, standard_color in enumerate(STANDARD_COLORS):
+        distance = _rgb_dist_sq(rgb, standard_color)
+        if distance < min_distance:
+            min_distance = distance
+            closest_index = i
+
+    return closest_index + 1
+
+
 class CursesColorAdapter:
     """
     Adapter for converting RGB colors to curses color pairs.
@@ -19,48 +82,19 @@ class CursesColorAdapter:
     terminal color limitations gracefully.
     """
 
-    def __init__(self, max_rgb_cache_size: int = 500):
+    __slots__ = ('color_pairs_initialized', 'has_colors', 'supports_256_colors',
+                 'max_pairs', '_attr_plain', '_attr_bold')
+
+    def __init__(self):
         """Initialize curses color adapter."""
         self.color_pairs_initialized = False
         self.has_colors = False
         self.supports_256_colors = False
-        self.rgb_to_pair_cache: Dict[Tuple[int, int, int], int] = {}
-        self.rgb_cache_access_times: Dict[Tuple[int, int, int], float] = {}
-        self.max_rgb_cache_size = max_rgb_cache_size
         self.max_pairs = 8  # Conservative for compatibility
 
-    def _evict_oldest_rgb_cache(self) -> None:
-        """Remove least recently used RGB cache entry."""
-        if not self.rgb_cache_access_times:
-            return
-
-        oldest_rgb = min(self.rgb_cache_access_times.keys(),
-                        key=lambda k: self.rgb_cache_access_times[k])
-        del self.rgb_to_pair_cache[oldest_rgb]
-        del self.rgb_cache_access_times[oldest_rgb]
-
-        # Standard curses colors for mapping
-        self.standard_colors = [
-            (255, 0, 0),    # Red
-            (255, 255, 0),  # Yellow
-            (0, 255, 0),    # Green
-            (0, 255, 255),  # Cyan
-            (0, 0, 255),    # Blue
-            (255, 0, 255),  # Magenta
-            (255, 255, 255), # White
-            (128, 128, 128), # Gray
-        ]
-
-        self.curses_colors = [
-            curses.COLOR_RED,
-            curses.COLOR_YELLOW,
-            curses.COLOR_GREEN,
-            curses.COLOR_CYAN,
-            curses.COLOR_BLUE,
-            curses.COLOR_MAGENTA,
-            curses.COLOR_WHITE,
-            curses.COLOR_WHITE,  # Fallback for gray
-        ]
+        # Composed attribute tables indexed by pair number (built in initialize_colors)
+        self._attr_plain: List[int] = []
+        self._attr_bold: List[int] = []
 
     def initialize_colors(self) -> bool:
         """
@@ -102,14 +136,21 @@ class CursesColorAdapter:
                 curses.init_pair(i, i % curses.COLORS, bg)
         else:
             # Initialize standard 8-color pairs for fallback
-            for i, color in enumerate(self.curses_colors):
-                if i < 8:
-                    curses.init_pair(i + 1, color, bg)
+            for i, color in enumerate(CURSES_COLORS):
+                curses.init_pair(i + 1, color, bg)
 
         self.has_colors = True
         self.color_pairs_initialized = True
+        self._build_attr_tables()
         return True
 
+    def _build_attr_tables(self) -> None:
+        """Pre-compose curses attributes for every usable pair, plain and bold."""
+        # 8-color pairs are numbered 1-8, so the table needs one slot past max_pairs there
+        pair_count = max(self.max_pairs, len(CURSES_COLORS) + 1)
+        self._attr_plain = [curses.color_pair(i) for i in range(pair_count)]
+        self._attr_bold = [attr | curses.A_BOLD for attr in self._attr_plain]
+
     def rgb_distance(self, rgb1: Tuple[int, int, int], rgb2: Tuple[int, int, int]) -> float:
         """
         Calculate Euclidean distance between two RGB colors.
@@ -121,9 +162,7 @@ class CursesColorAdapter:
         Returns:
             Distance between colors
         """
-        r1, g1, b1 = rgb1
-        r2, g2, b2 = rgb2
-        return ((r1 - r2) ** 2 + (g1 - g2) ** 2 + (b1 - b2) ** 2) ** 0.5
+        return _rgb_dist_sq(rgb1, rgb2) ** 0.5
 
     def rgb_to_color_pair(self, rgb: Tuple[int, int, int]) -> int:
         """
@@ -135,44 +174,14 @@ class CursesColorAdapter:
         Returns:
             Curses color pair number (1-8)
         """
-        # Check cache first
-        if rgb in self.rgb_to_pair_cache:
-            self.rgb_cache_access_times[rgb] = time.time()
-            return self.rgb_to_pair_cache[rgb]
-
         if not self.has_colors:
             return 0  # No color support
 
+        # 256 colors: three table lookups; 8 colors: memoized nearest-color search
+        r, g, b = rgb
         if self.supports_256_colors:
-            # Use 256-color mapping
-            r, g, b = rgb
-            # Map to 6x6x6 color cube (colors 16-231)
-            r6 = min(5, r * 6 // 256)
-            g6 = min(5, g * 6 // 256)
-            b6 = min(5, b * 6 // 256)
-            color_256 = 16 + (36 * r6) + (6 * g6) + b6
-            color_pair = min(color_256, self.max_pairs - 1)
-        else:
-            # Find closest standard color for 8-color terminals
-            min_distance = float('inf')
-            closest_index = 0
-
-            for i, standard_color in enumerate(self.standard_colors):
-                distance = self.rgb_distance(rgb, standard_color)
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_index = i
-
-            color_pair = closest_index + 1
-
-        # Evict oldest entries if cache is full
-        if len(self.rgb_to_pair_cache) >= self.max_rgb_cache_size:
-            self._evict_oldest_rgb_cache()
-
-        # Cache result
-        self.rgb_to_pair_cache[rgb] = color_pair
-        self.rgb_cache_access_times[rgb] = time.time()
-        return color_pair
+            return _rgb_to_pair_256(r, g, b, self.max_pairs)
+        return _rgb_to_pair_8(r, g, b)
 
     def get_color_attr(self, rgb: Tuple[int, int, int], bold: bool = True) -> int:
         """
@@ -188,13 +197,30 @@ class CursesColorAdapter:
         if not self.has_colors:
             return curses.A_BOLD if bold else 0
 
-        color_pair = self.rgb_to_color_pair(rgb)
-        attr = curses.color_pair(color_pair)
+        return (self._attr_bold if bold else self._attr_plain)[self.rgb_to_color_pair(rgb)]
 
-        if bold:
-            attr |= curses.A_BOLD
+    def get_color_attrs(self, rgb_sequence: List[Tuple[int, int, int]], bold: bool = True) -> List[int]:
+        """
+        Get curses color attributes for a whole RGB sequence in one batch.
 
-        return attr
+        Resolves the color-depth dispatch and bold flag once per sequence
+        instead of once per color.
+
+        Args:
+            rgb_sequence: List of RGB color tuples
+            bold: Whether to apply bold attribute
+
+        Returns:
+            List of curses color attributes, one per input color
+        """
+        if not self.has_colors:
+            return [curses.A_BOLD if bold else 0] * len(rgb_sequence)
+
+        attrs = self._attr_bold if bold else self._attr_plain
+        if self.supports_256_colors:
+            max_pairs = self.max_pairs
+            return [attrs[_rgb_to_pair_256(r, g, b, max_pairs)] for r, g, b in rgb_sequence]
+        return [attrs[_rgb_to_pair_8(r, g, b)] for r, g, b in rgb_sequence]
 
 
 class CursesRainbowSequence:
@@ -205,15 +231,21 @@ class CursesRainbowSequence:
     during animation loops.
     """
 
-    def __init__(self, adapter: CursesColorAdapter):
+    def __init__(self, adapter: CursesColorAdapter, phase_bins: int = 360):
         """
         Initialize rainbow sequence generator.
 
         Args:
             adapter: CursesColorAdapter instance
+            phase_bins: Number of distinct animation offsets per cycle; offsets
+                are snapped to this grid so repeated frames hit the cache
         """
         self.adapter = adapter
-        self.cached_sequences: Dict[str, List[int]] = {}
+        self.phase_bins = phase_bins
+        self.max_cached_sequences = phase_bins * 4
+        self.cached_sequences: Dict[Tuple[int, int, bool, Optional[str]], List[int]] = {}
+        # Offset-0 RGB sequences per (length, scheme), rotated for other offsets
+        self._base_rgb: Dict[Tuple[int, Optional[str]], List[Tuple[int, int, int]]] = {}
 
     def generate_sequence(self, length: int, offset: float = 0.0,
                          bold: bool = True, color_scheme: str = None) -> List[int]:
@@ -229,33 +261,49 @@ class CursesRainbowSequence:
         Returns:
             List of curses color attributes
         """
-        # Create cache key
-        cache_key = f"{length}_{offset:.3f}_{bold}_{color_scheme or 'rainbow'}"
-
-        if cache_key in self.cached_sequences:
-            return self.cached_sequences[cache_key]
-
-        # Generate RGB sequence based on color scheme
-        if color_scheme:
-            rgb_sequence = ColorGenerator.generate_monochromatic_gradient(color_scheme, length, offset=offset)
+        # Snap offset to the nearest phase bin (rounding, so e.g. 35/360 doesn't
+        # floor to bin 34); the tuple key needs no string formatting
+        phase_bin = int(offset * self.phase_bins + 0.5) % self.phase_bins
+        cache_key = (length, phase_bin, bold, color_scheme)
+
+        cached = self.cached_sequences.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Sequences are periodic: when the snapped offset is a whole number of
+        # elements, rotate the offset-0 sequence instead of regenerating it
+        shift, remainder = divmod(phase_bin * length, self.phase_bins)
+        if remainder == 0:
+            base = self._base_rgb.get((length, color_scheme))
+            if base is None:
+                base = self._generate_rgb(length, 0.0, color_scheme)
+                self._base_rgb[(length, color_scheme)] = base
+            rgb_sequence = base[shift:] + base[:shift]
         else:
-            rgb_sequence = ColorGenerator.generate_rainbow_sequence(length, saturation=0.75, value=0.9, offset=offset)
+            # Generate at the snapped offset, so every offset in a bin yields
+            # the same cached sequence
+            rgb_sequence = self._generate_rgb(length, phase_bin / self.phase_bins, color_scheme)
 
-        # Convert to curses attributes
-        attr_sequence = []
-        for rgb in rgb_sequence:
-            attr = self.adapter.get_color_attr(rgb, bold=bold)
-            attr_sequence.append(attr)
+        # Convert to curses attributes in one batch
+        attr_sequence = self.adapter.get_color_attrs(rgb_sequence, bold=bold)
 
         # Cache result (limit cache size)
-        if len(self.cached_sequences) < 100:
+        if len(self.cached_sequences) < self.max_cached_sequences:
             self.cached_sequences[cache_key] = attr_sequence
 
         return attr_sequence
 
+    @staticmethod
+    def _generate_rgb(length: int, offset: float, color_scheme: Optional[str]) -> List[Tuple[int, int, int]]:
+        """Generate the RGB sequence for a color scheme (None for rainbow)."""
+        if color_scheme:
+            return ColorGenerator.generate_monochromatic_gradient(color_scheme, length, offset=offset)
+        return ColorGenerator.generate_rainbow_sequence(length, saturation=0.75, value=0.9, offset=offset)
+
     def clear_cache(self):
         """Clear cached color sequences."""
         self.cached_sequences.clear()
+        self._base_rgb.clear()
 
 
 def create_curses_adapter() -> CursesColorAdapter:
@@ -5,9 +5,57 @@ Provides RGB/HSV color space utilities and rainbow/prism color generation algori
 optimized for real-time terminal animation with pure curses integration.
 """
 
-import colorsys
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Tuple, List, Union
 
+# Two-digit hex for every channel value: formatting becomes three lookups
+_HEX = tuple(f"{i:02x}" for i in range(256))
+
+# Monochromatic gradient anchors (dark to light), shared by every call;
+# read-only so the memoized extended gradients can't go stale
+_MONO_GRADIENTS = MappingProxyType({
+    'red': ((150, 20, 20), (200, 30, 30), (255, 0, 0), (255, 50, 50), (255, 80, 80)),
+    'blue': ((30, 30, 150), (0, 50, 200), (0, 0, 255), (50, 100, 255), (100, 150, 255)),
+    'green': ((0, 80, 0), (0, 255, 0), (128, 255, 128)),
+    'yellow': ((128, 128, 0), (255, 255, 0), (255, 255, 128)),
+    'purple': ((80, 0, 80), (128, 0, 128), (200, 128, 200)),
+    'cyan': ((0, 80, 80), (0, 255, 255), (128, 255, 255)),
+    'gray': ((64, 64, 64), (128, 128, 128), (192, 192, 192)),
+    'pink': ((180, 100, 140), (220, 130, 170), (255, 160, 190), (255, 192, 203), (255, 200, 210)),
+    'orange': ((180, 60, 0), (215, 110, 0), (255, 140, 0), (255, 180, 40), (255, 195, 80)),
+})
+
+
+def _hsv_to_rgb_fast(hue: float, saturation: float, value: float) -> Tuple[int, int, int]:
+    """
+    Convert in-range HSV values to RGB integers without clamping.
+
+    Uses colorsys.hsv_to_rgb's sector arithmetic, scaled to 0-255. Callers
+    guarantee saturation and value lie in 0.0-1.0 and hue in 0.0-1.0.
+    """
+    full = int(value * 255)
+    if saturation == 0.0:
+        return (full, full, full)
+
+    h6 = hue * 6.0
+    sector = int(h6)
+    f = h6 - sector
+    sector %= 6
+    low = int(value * (1.0 - saturation) * 255)
+
+    if sector == 0:
+        return (full, int(value * (1.0 - saturation * (1.0 - f)) * 255), low)
+    if sector == 1:
+        return (int(value * (1.0 - saturation * f) * 255), full, low)
+    if sector == 2:
+        return (low, full, int(value * (1.0 - saturation * (1.0 - f)) * 255))
+    if sector == 3:
+        return (low, int(value * (1.0 - saturation * f) * 255), full)
+    if sector == 4:
+        return (int(value * (1.0 - saturation * (1.0 - f)) * 255), low, full)
+    return (full, low, int(value * (1.0 - saturation * f) * 255))
+
 
 class ColorGenerator:
     """
@@ -35,8 +83,7 @@ class ColorGenerator:
         saturation = max(0.0, min(1.0, saturation))
         value = max(0.0, min(1.0, value))
 
-        rgb_float = colorsys.hsv_to_rgb(hue, saturation, value)
-        return tuple(int(c * 255) for c in rgb_float)
+        return _hsv_to_rgb_fast(hue, saturation, value)
 
     @staticmethod
     def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
@@ -48,9 +95,17 @@ class ColorGenerator:
 
         Returns:
             Hex color string (e.g., "#ff0000")
+
+        Raises:
+            ValueError: If a channel is outside 0-255. Out-of-range channels
+                        were formatted as-is (e.g. "-1" or "100") before the
+                        lookup-table version; they are now rejected.
         """
         r, g, b = rgb
-        return f"#{r:02x}{g:02x}{b:02x}"
+        # Checked up front: a negative index would silently wrap in the table
+        if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
+            raise ValueError(f"RGB channels must be 0-255, got {rgb}")
+        return f"#{_HEX[r]}{_HEX[g]}{_HEX[b]}"
 
     @staticmethod
     def generate_rainbow_color(position: float, saturation: float = 1.0, value: float = 1.0) -> Tuple[int, int, int]:
@@ -69,9 +124,9 @@ class ColorGenerator:
         Returns:
             RGB tuple as (red, green, blue) integers 0-255
         """
-        # Normalize position to 0.0-1.0 range
-        position = position % 1.0
-        return ColorGenerator.hsv_to_rgb(position, saturation, value)
+        # Normalizing the position already puts the hue in range; only
+        # saturation and value still need clamping
+        return _hsv_to_rgb_fast(position % 1.0, max(0.0, min(1.0, saturation)), max(0.0, min(1.0, value)))
 
     @staticmethod
     def generate_rainbow_color_hex(position: float, saturation: float = 1.0, value: float = 1.0) -> str:
@@ -133,13 +188,14 @@ class ColorGenerator:
         if steps < 2:
             return [start_color, end_color]
 
-        gradient = []
-        for i in range(steps):
-            factor = i / (steps - 1)
-            color = ColorGenerator.interpolate_colors(start_color, end_color, factor)
-            gradient.append(color)
-
-        return gradient
+        # interpolate_colors specialized to the evenly spaced factors i / (steps - 1):
+        # channel deltas are computed once and each step is exact integer
+        # floor division, with no float math and no clamping
+        r0, g0, b0 = start_color
+        dr, dg, db = end_color[0] - r0, end_color[1] - g0, end_color[2] - b0
+        last = steps - 1
+        return [(r0 + dr * i // last, g0 + dg * i // last, b0 + db * i // last)
+                for i in range(steps)]
 
     @staticmethod
     def generate_rainbow_sequence(length: int, saturation: float = 1.0, value: float = 1.0, offset: float = 0.0) -> List[Tuple[int, int, int]]:
@@ -158,16 +214,7 @@ class ColorGenerator:
         Returns:
             List of RGB color tuples for text character styling
         """
-        if length <= 0:
-            return []
-
-        colors = []
-        for i in range(length):
-            position = (i / length + offset) % 1.0
-            color = ColorGenerator.generate_rainbow_color(position, saturation, value)
-            colors.append(color)
-
-        return colors
+        return _rainbow_sequence(length, saturation, value, offset)
 
     @staticmethod
     def generate_rainbow_sequence_hex(length: int, saturation: float = 1.0, value: float = 1.0, offset: float = 0.0) -> List[str]:
@@ -185,8 +232,26 @@ class ColorGenerator:
         Returns:
             List of hex color strings for terminal styling
         """
-        rgb_colors = ColorGenerator.generate_rainbow_sequence(length, saturation, value, offset)
-        return [ColorGenerator.rgb_to_hex(rgb) for rgb in rgb_colors]
+        return _rainbow_sequence_hex(length, saturation, value, offset)
+
+    @staticmethod
+    def generate_rainbow_sequence_packed(length: int, saturation: float = 1.0, value: float = 1.0, offset: float = 0.0) -> bytes:
+        """
+        Generate rainbow color sequence as packed RGB bytes.
+
+        Same colors as generate_rainbow_sequence(), laid out as one contiguous
+        buffer (r0 g0 b0 r1 g1 b1 ...) instead of a list of tuples.
+
+        Args:
+            length: Number of colors to generate
+            saturation: Color saturation 0.0-1.0
+            value: Brightness 0.0-1.0
+            offset: Starting position offset 0.0-1.0 for animation cycling
+
+        Returns:
+            Bytes object with three bytes per color
+        """
+        return _rainbow_sequence_packed(length, saturation, value, offset)
 
     @staticmethod
     def generate_monochromatic_gradient(color_name: str, length: int, offset: float = 0.0) -> List[Tuple[int, int, int]]:
@@ -207,42 +272,112 @@ class ColorGenerator:
         if length <= 0:
             return []
 
-        # Define color gradients (dark to light)
-        color_gradients = {
-            'red': [(150, 20, 20), (200, 30, 30), (255, 0, 0), (255, 50, 50), (255, 80, 80)],
-            'blue': [(30, 30, 150), (0, 50, 200), (0, 0, 255), (50, 100, 255), (100, 150, 255)],
-            'green': [(0, 80, 0), (0, 255, 0), (128, 255, 128)],
-            'yellow': [(128, 128, 0), (255, 255, 0), (255, 255, 128)],
-            'purple': [(80, 0, 80), (128, 0, 128), (200, 128, 200)],
-            'cyan': [(0, 80, 80), (0, 255, 255), (128, 255, 255)],
-            'gray': [(64, 64, 64), (128, 128, 128), (192, 192, 192)],
-            'pink': [(180, 100, 140), (220, 130, 170), (255, 160, 190), (255, 192, 203), (255, 200, 210)],
-            'orange': [(180, 60, 0), (215, 110, 0), (255, 140, 0), (255, 180, 40), (255, 195, 80)]
-        }
-
-        if color_name not in color_gradients:
+        if color_name not in _MONO_GRADIENTS:
             # Fallback to rainbow if unknown color
             return ColorGenerator.generate_rainbow_sequence(length, offset=offset)
 
-        gradient_colors = color_gradients[color_name]
+        # The extended gradient depends only on the color and segment length
+        extended_gradient = _mono_extended_gradient(color_name, max(10, length // 2))
 
-        # Create extended gradient with smooth transitions
-        extended_gradient = []
-        steps_per_segment = max(10, length // 2)
+        # Generate colors for text with offset
+        return list(map(extended_gradient.__getitem__,
+                        _palette_indices(length, offset, len(extended_gradient))))
 
-        for i in range(len(gradient_colors) - 1):
-            start_color = gradient_colors[i]
-            end_color = gradient_colors[i + 1]
-            segment = ColorGenerator.generate_gradient_colors(start_color, end_color, steps_per_segment)
-            if i > 0:
-                segment = segment[1:]  # Avoid duplication
-            extended_gradient.extend(segment)
 
-        # Generate colors for text with offset
-        colors = []
-        for i in range(length):
-            position = (i / length + offset) * len(extended_gradient)
-            gradient_index = int(position) % len(extended_gradient)
-            colors.append(extended_gradient[gradient_index])
+@lru_cache(maxsize=64)
+def _mono_extended_gradient(color_name: str, steps_per_segment: int) -> Tuple[Tuple[int, int, int], ...]:
+    """Join the anchor colors of a monochromatic gradient with smooth segments."""
+    gradient_colors = _MONO_GRADIENTS[color_name]
+
+    extended_gradient = []
+    for i in range(len(gradient_colors) - 1):
+        start_color = gradient_colors[i]
+        end_color = gradient_colors[i + 1]
+        segment = ColorGenerator.generate_gradient_colors(start_color, end_color, steps_per_segment)
+        if i > 0:
+            segment = segment[1:]  # Avoid duplication
+        extended_gradient.extend(segment)
+
+    return tuple(extended_gradient)
+
+
+# Hue resolution of the rainbow tables: 6 sectors x 256 steps, so adjacent
+# entries differ by at most one 8-bit level in any channel
+_HUE_STEPS = 1536
+
+
+@lru_cache(maxsize=32)
+def _hue_table(saturation: float, value: float) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Build the full-spectrum lookup table for one saturation/value pair.
+
+    Entry j holds the color at hue j / _HUE_STEPS. One extra entry repeats
+    hue 0 so a position that rounds up to 1.0 still indexes safely.
+    """
+    # Arguments arrive clamped, so the unchecked conversion is safe here
+    table = [_hsv_to_rgb_fast(j / _HUE_STEPS, saturation, value) for j in range(_HUE_STEPS)]
+    table.append(table[0])
+
+    return tuple(table)
+
+
+def _palette_indices(length: int, offset: float, palette_length: int) -> List[int]:
+    """
+    Palette indices for spreading a cyclic palette across a sequence.
+
+    Element i sits at (i / length + offset) of the way around the palette,
+    and its index is floor((i / length + offset) * palette_length), taken
+    exactly. Measured in units of 1 / (length * palette_length), every
+    element position is an integer, so each index is a floor division with
+    no per-element float math. The offset is floored onto that grid once,
+    from its exact binary value, so it never rounds an element ahead.
+    """
+    span = length * palette_length
+    numerator, denominator = offset.as_integer_ratio()
+    shift = numerator * span // denominator % span
+    return [(pos // length) % palette_length
+            for pos in range(shift, shift + span, palette_length)]
+
+
+# Sequences are not memoized: the offset changes every frame, and callers
+# that replay frames (ColorAnimator, CursesRainbowSequence) keep their own
+# bounded caches. Only the per-(saturation, value) tables are cached.
+def _rainbow_sequence(length: int, saturation: float, value: float, offset: float) -> List[Tuple[int, int, int]]:
+    """Compute a rainbow sequence by indexing the hue table."""
+    if length <= 0:
+        return []
+
+    # Clamp once, then each element is a single index into the hue table
+    table = _hue_table(max(0.0, min(1.0, saturation)), max(0.0, min(1.0, value)))
+    return list(map(table.__getitem__, _palette_indices(length, offset, _HUE_STEPS)))
+
+
+@lru_cache(maxsize=32)
+def _hue_table_hex(saturation: float, value: float) -> Tuple[str, ...]:
+    """Hex strings for each entry of _hue_table (same arguments, same indexing)."""
+    return tuple(f"#{_HEX[r]}{_HEX[g]}{_HEX[b]}" for r, g, b in _hue_table(saturation, value))
+
+
+def _rainbow_sequence_hex(length: int, saturation: float, value: float, offset: float) -> List[str]:
+    """Hex form of _rainbow_sequence, indexed straight from the hex table."""
+    if length <= 0:
+        return []
+
+    # Single pass: no intermediate RGB sequence and no per-element formatting
+    table = _hue_table_hex(max(0.0, min(1.0, saturation)), max(0.0, min(1.0, value)))
+    return list(map(table.__getitem__, _palette_indices(length, offset, _HUE_STEPS)))
+
+
+@lru_cache(maxsize=32)
+def _hue_table_packed(saturation: float, value: float) -> Tuple[bytes, ...]:
+    """Three-byte RGB chunks for each entry of _hue_table (same arguments, same indexing)."""
+    return tuple(bytes(rgb) for rgb in _hue_table(saturation, value))
+
+
+def _rainbow_sequence_packed(length: int, saturation: float, value: float, offset: float) -> bytes:
+    """Packed-bytes form of _rainbow_sequence, joined straight from the table."""
+    if length <= 0:
+        return b''
 
-        return colors
\ No newline at end of file
+    table = _hue_table_packed(max(0.0, min(1.0, saturation)), max(0.0, min(1.0, value)))
+    return b''.join(map(table.__getitem__, _palette_indices(length, offset, _HUE_STEPS)))
@@ -5,10 +5,16 @@ Provides PrismColors and CustomColors classes for managing different color schem
 with pure curses integration and real-time animation optimization.
 """
 
+import re
 from abc import ABC, abstractmethod
+from itertools import chain
 from typing import List, Tuple, Union, Optional
 
-from .generator import ColorGenerator
+from .generator import ColorGenerator, _palette_indices
+
+# "#RRGGBB" or "#RGB", leading '#' optional; checked up front because int(x, 16)
+# alone would also accept signs, whitespace, "0x" and underscores
+_HEX_COLOR = re.compile(r'#?([0-9a-fA-F]{6}|[0-9a-fA-F]{3})')
 
 
 class BaseColorScheme(ABC):
@@ -19,6 +25,8 @@ class BaseColorScheme(ABC):
     consistent integration with animation modes.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_colors_for_text(self, text_length: int, offset: float = 0.0) -> List[Tuple[int, int, int]]:
         """
@@ -47,6 +55,22 @@ class BaseColorScheme(ABC):
         """
         pass
 
+    def get_colors_packed(self, text_length: int, offset: float = 0.0) -> bytes:
+        """
+        Generate colors for text as packed RGB bytes.
+
+        Default implementation packs get_colors_for_text(); schemes with a
+        native packed path override it.
+
+        Args:
+            text_length: Number of characters to generate colors for
+            offset: Animation offset 0.0-1.0 for cycling effects
+
+        Returns:
+            Bytes object with three bytes (r, g, b) per character
+        """
+        return bytes(chain.from_iterable(self.get_colors_for_text(text_length, offset)))
+
 
 class PrismColors(BaseColorScheme):
     """
@@ -56,6 +80,8 @@ class PrismColors(BaseColorScheme):
     using HSV color space for vivid, animated rainbow effects.
     """
 
+    __slots__ = ('saturation', 'value')
+
     def __init__(self, saturation: float = 1.0, value: float = 1.0):
         """
         Initialize prism color scheme.
@@ -108,6 +134,24 @@ class PrismColors(BaseColorScheme):
             offset=offset
         )
 
+    def get_colors_packed(self, text_length: int, offset: float = 0.0) -> bytes:
+        """
+        Generate rainbow colors for text characters as packed RGB bytes.
+
+        Args:
+            text_length: Number of characters to generate colors for
+            offset: Animation offset 0.0-1.0 for rotating rainbow effect
+
+        Returns:
+            Bytes object with three bytes (r, g, b) per character
+        """
+        return ColorGenerator.generate_rainbow_sequence_packed(
+            length=text_length,
+            saturation=self.saturation,
+            value=self.value,
+            offset=offset
+        )
+
     def get_spectrum_preview(self, length: int = 20) -> List[Tuple[int, int, int]]:
         """
         Generate color preview of the rainbow spectrum.
@@ -131,6 +175,8 @@ class CustomColors(BaseColorScheme):
     defined colors using interpolation and gradient generation.
     """
 
+    __slots__ = ('colors', '_extended', '_ext_len', '_extended_hex', '_extended_packed')
+
     def __init__(self, colors: List[Union[Tuple[int, int, int], str]]):
         """
         Initialize custom color scheme.
@@ -144,6 +190,13 @@ class CustomColors(BaseColorScheme):
 
         self.colors = self._normalize_colors(colors)
 
+        # The gradient palette depends only on self.colors, so build it once
+        self._extended = self._build_extended_palette()
+        self._ext_len = len(self._extended)
+        # Hex and packed forms of the same entries, indexed identically
+        self._extended_hex = tuple(ColorGenerator.rgb_to_hex(rgb) for rgb in self._extended)
+        self._extended_packed = tuple(bytes(rgb) for rgb in self._extended)
+
     def _normalize_colors(self, colors: List[Union[Tuple[int, int, int], str]]) -> List[Tuple[int, int, int]]:
         """
         Convert all color inputs to normalized RGB tuples.
@@ -162,19 +215,17 @@ class CustomColors(BaseColorScheme):
                 r, g, b = color
                 normalized.append((max(0, min(255, int(r))), max(0, min(255, int(g))), max(0, min(255, int(b)))))
             elif isinstance(color, str):
-                # Hex string - parse manually
-                if color.startswith('#'):
-                    hex_color = color[1:]
-                else:
-                    hex_color = color
-
-                if len(hex_color) == 6:
-                    r = int(hex_color[0:2], 16)
-                    g = int(hex_color[2:4], 16)
-                    b = int(hex_color[4:6], 16)
-                    normalized.append((r, g, b))
-                else:
+                # Hex string - validate once, parse once, split channels with shifts
+                match = _HEX_COLOR.fullmatch(color)
+                if match is None:
                     raise ValueError(f"Invalid hex color format: {color}")
+
+                hex_color = match.group(1)
+                if len(hex_color) == 3:
+                    hex_color = ''.join(c * 2 for c in hex_color)  # "f0a" -> "ff00aa"
+
+                packed = int(hex_color, 16)
+                normalized.append(((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF))
             else:
                 raise ValueError(f"Unsupported color format: {color}")
 
@@ -197,10 +248,16 @@ class CustomColors(BaseColorScheme):
         if text_length <= 0:
             return []
 
-        # Calculate total palette length including gradients between colors
-        total_palette_length = len(self.colors) * 10  # 10 steps between each color pair
+        # Index the prebuilt palette with offset
+        return list(map(self._extended.__getitem__, _palette_indices(text_length, offset, self._ext_len)))
 
-        # Generate extended color palette with gradients
+    def _build_extended_palette(self) -> Tuple[Tuple[int, int, int], ...]:
+        """
+        Build the palette with 10-step gradients between consecutive colors.
+
+        Returns:
+            Tuple of RGB colors cycling through all defined colors
+        """
         extended_palette = []
         for i in range(len(self.colors)):
             start_color = self.colors[i]
@@ -208,16 +265,7 @@ class CustomColors(BaseColorScheme):
             gradient = ColorGenerator.generate_gradient_colors(start_color, end_color, 10)
             extended_palette.extend(gradient[:-1])  # Exclude last to avoid duplication
 
-        # Generate colors for text with offset
-        text_colors = []
-        for i in range(text_length):
-            # Calculate position in extended palette with offset
-            position = (i / text_length + offset) * len(extended_palette)
-            palette_index = int(position) % len(extended_palette)
-            rgb_color = extended_palette[palette_index]
-            text_colors.append(rgb_color)
-
-        return text_colors
+        return tuple(extended_palette)
 
     def get_colors_hex(self, text_length: int, offset: float = 0.0) -> List[str]:
         """
@@ -230,8 +278,26 @@ class CustomColors(BaseColorScheme):
         Returns:
             List of hex color strings for each character
         """
-        rgb_colors = self.get_colors_for_text(text_length, offset)
-        return [ColorGenerator.rgb_to_hex(rgb) for rgb in rgb_colors]
+        if text_length <= 0:
+            return []
+
+        return list(map(self._extended_hex.__getitem__, _palette_indices(text_length, offset, self._ext_len)))
+
+    def get_colors_packed(self, text_length: int, offset: float = 0.0) -> bytes:
+        """
+        Generate custom palette colors for text characters as packed RGB bytes.
+
+        Args:
+            text_length: Number of characters to generate colors for
+            offset: Animation offset 0.0-1.0 for cycling through palette
+
+        Returns:
+            Bytes object with three bytes (r, g, b) per character
+        """
+        if text_length <= 0:
+            return b''
+
+        return b''.join(map(self._extended_packed.__getitem__, _palette_indices(text_length, offset, self._ext_len)))
 
     def get_palette_preview(self) -> List[Tuple[int, int, int]]:
         """
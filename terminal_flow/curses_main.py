@@ -138,6 +138,10 @@ def main():
             'morph': MorphMode()
         }
 
+        # Share the discovery loader so file contents are read once, not per mode
+        for mode_instance in mode_instances.values():
+            mode_instance.loader = loader
+
         # Start with initial mode
         current_mode = args.mode
         current_file_index = starting_file_index
@@ -147,15 +151,16 @@ def main():
             nonlocal current_mode, current_file_index, current_color_scheme
 
             while True:
-                # Get mode instance for current mode
-                mode_instance = mode_instances.get(current_mode, mode_instances['wave'])
+                # Modes come from argparse choices or the modes' own cycle list,
+                # so the key is always present
+                mode_instance = mode_instances[current_mode]
 
-                # Ensure mode instance has the current color scheme and regenerate palette
+                # Hand over the current color scheme; run() builds the palette
+                # (and mode-specific gradients) from it on entry
                 if mode_instance.current_color_scheme != current_color_scheme:
                     mode_instance.current_color_scheme = current_color_scheme
                     if current_color_scheme in mode_instance.color_schemes:
                         mode_instance.current_color_index = mode_instance.color_schemes.index(current_color_scheme)
-                    mode_instance.on_color_change()  # Regenerate color palette
 
                 # Run mode instance
                 result = mode_instance.run(stdscr, selected_files, args.speed, update_interval, cycle_interval, current_color_scheme, current_file_index)
@@ -17,13 +17,19 @@ class FluxMode(BaseAnimationMode):
     creating a synchronized color-changing effect across the entire display.
     """
 
+    full_cover = True  # Redraws every visible character whenever the color changes
+
     def __init__(self):
         super().__init__('flux')
         self.flux_offset = 0.0
+        self._shown_attr = None  # Uniform attribute currently on screen
+        self._runs = []  # (row, col, text) spans written with one addstr each
 
     def initialize_mode_variables(self):
         """Initialize flux-specific animation variables."""
         self.flux_offset = 0.0
+        self._shown_attr = None
+        self._runs = self.compute_visible_runs()
 
     def update_animation_state(self, animation_speed, update_interval):
         """Update flux animation offset."""
@@ -31,33 +37,32 @@ class FluxMode(BaseAnimationMode):
         if self.flux_offset >= 1.0:
             self.flux_offset -= 1.0
 
+    def on_resize(self):
+        """Re-split content into runs for the new screen size."""
+        self._runs = self.compute_visible_runs()
+
+    def on_file_change(self):
+        """Re-split the new file's content into runs."""
+        self._runs = self.compute_visible_runs()
+
     def draw_frame(self):
         """Draw flux animation frame with uniform color for all characters."""
-        max_rows, max_cols = self.stdscr.getmaxyx()
-
         # Get single color for all characters from pre-computed palette (optimized)
         uniform_attr = self.get_color_from_palette(self.flux_offset) | curses.A_DIM
 
-        # Draw animated text with uniform flux color
-        for line_idx, line in enumerate(self.lines):
-            if line_idx + self.start_row >= max_rows:
-                break
-
-            for char_idx, char in enumerate(line):
-                # Skip whitespace characters entirely for performance
-                if not char.strip():
-                    continue
-
-                col = self.start_col + char_idx
-                row = self.start_row + line_idx
-
-                if col >= max_cols or row >= max_rows:
-                    continue
-
-                try:
-                    self.stdscr.addstr(row, col, char, uniform_attr)
-                except curses.error:
-                    pass  # Ignore screen boundary errors
+        # Every character shares one color: if it hasn't changed and the screen
+        # wasn't wiped, what's displayed is already this frame
+        if uniform_attr == self._shown_attr and not self.screen_wiped:
+            return
+        self._shown_attr = uniform_attr
+
+        # Draw animated text with uniform flux color, one call per run
+        addstr = self.stdscr.addstr
+        for row, col, text in self._runs:
+            try:
+                addstr(row, col, text, uniform_attr)
+            except curses.error:
+                pass  # Ignore screen boundary errors
 
 
 # Legacy function wrapper for backward compatibility
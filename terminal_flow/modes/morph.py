@@ -30,26 +30,52 @@ class WaveField:
             cols: Maximum number of columns
             max_tier: Maximum wave height (maps to gradient length - 1)
         """
-        self.rows = rows
-        self.cols = cols
         self.max_tier = max_tier
         self.median_height = max_tier // 2
+        self.rows = None
+        self.cols = None
+        self.resize(rows, cols)
+
+    def resize(self, rows, cols):
+        """
+        Fit the field to a grid size, reusing the static tables if it is unchanged.
+
+        Heights always restart from the median, as in a freshly built field.
 
+        Args:
+            rows: Number of text rows
+            cols: Maximum number of columns
+        """
         # Wave height field (current wave heights)
-        self.heights = [[float(self.median_height) for _ in range(cols)] for _ in range(rows)]
+        self.heights = [[float(self.median_height)] * cols for _ in range(rows)]
+
+        if rows == self.rows and cols == self.cols:
+            return
+        self.rows = rows
+        self.cols = cols
 
         # Pre-compute optimization constants
         self.center_row = rows // 2
         self.center_col = cols // 2
 
-        # Pre-compute distance grid for radial waves (optimization)
-        self.distance_grid = []
-        for r in range(rows):
-            row_distances = []
-            for c in range(cols):
-                distance = math.sqrt((r - self.center_row) ** 2 + (c - self.center_col) ** 2)
-                row_distances.append(distance)
-            self.distance_grid.append(row_distances)
+        # Pre-compute distance grid for radial waves (optimization); the
+        # column offsets are shared by every row, so only dy varies per row
+        sqrt = math.sqrt
+        col_offsets_sq = [(c - self.center_col) ** 2 for c in range(cols)]
+        self.distance_grid = [
+            [sqrt(dy_sq + dx_sq) for dx_sq in col_offsets_sq]
+            for dy_sq in [(r - self.center_row) ** 2 for r in range(rows)]
+        ]
+
+        # Static halves of the angle-addition expansions used by propagate_waves:
+        # sin(x + t) = sin(x)cos(t) + cos(x)sin(t) splits every per-cell sine
+        # into a per-cell (or per-column) table and a per-frame scalar
+        self.radial_sin = [[math.sin(d * 0.4) for d in row] for row in self.distance_grid]
+        self.radial_cos = [[math.cos(d * 0.4) for d in row] for row in self.distance_grid]
+        self.ripple_cos = [math.cos(c * 0.6) for c in range(cols)]
+        self.ripple_sin = [math.sin(c * 0.6) for c in range(cols)]
+        self.detail_cos = [math.cos(c * 1.1) for c in range(cols)]
+        self.detail_sin = [math.sin(c * 1.1) for c in range(cols)]
 
     def get_height(self, row, col):
         """Get wave height at position (with bounds checking)."""
@@ -87,6 +113,30 @@ class WaveField:
             row_range = range(self.rows)
             line_lengths = [self.cols] * self.rows
 
+        # Terms that depend on only one coordinate (or on r + c) are evaluated
+        # once per frame; the rest are expanded with sin(x + t) identities into
+        # static tables times per-frame (or per-row) scalars, so no sine is
+        # evaluated per cell
+        sin = math.sin
+        cos = math.cos
+        max_tier = self.max_tier
+        ceiling = float(max_tier)
+        median = self.median_height
+        t15, t18, t20, t25, t30, t40 = (time_offset * 1.5, time_offset * 1.8, time_offset * 2.0,
+                                        time_offset * 2.5, time_offset * 3.0, time_offset * 4.0)
+        a1, a2, a3, a4, a5, a6 = (max_tier * 0.15, max_tier * 0.12, max_tier * 0.1,
+                                  max_tier * 0.08, max_tier * 0.05, max_tier * 0.03)
+
+        # Wave 1: Horizontal sine wave flowing right (per column)
+        wave1_cols = [sin((c * 0.3 + t20)) * a1 for c in range(self.cols)]
+        # Wave 3: Diagonal wave flowing diagonally (per r + c)
+        wave3_diag = [sin(d * 0.2 + t18) * a3 for d in range(self.rows + self.cols)]
+        # Wave 4: Radial wave from center, sin(d*0.4 - t) as per-cell tables times these
+        radial_s = cos(t25) * a4
+        radial_c = -sin(t25) * a4
+        ripple_cos, ripple_sin = self.ripple_cos, self.ripple_sin
+        detail_cos, detail_sin = self.detail_cos, self.detail_sin
+
         # Multiple overlapping wave functions for complex interference patterns
         for r in row_range:
             # Optimize column range based on actual line length
@@ -95,35 +145,28 @@ class WaveField:
             else:
                 col_limit = self.cols
 
-            for c in range(col_limit):
-                # Initialize at median
-                total_height = self.median_height
-
-                # Wave 1: Horizontal sine wave flowing right
-                wave1 = math.sin((c * 0.3 + time_offset * 2.0)) * (self.max_tier * 0.15)
-
-                # Wave 2: Vertical sine wave flowing down
-                wave2 = math.sin((r * 0.25 + time_offset * 1.5)) * (self.max_tier * 0.12)
-
-                # Wave 3: Diagonal wave flowing diagonally
-                wave3 = math.sin((r + c) * 0.2 + time_offset * 1.8) * (self.max_tier * 0.1)
-
-                # Wave 4: Radial wave from center (optimized with pre-computed distance)
-                distance_from_center = self.distance_grid[r][c]
-                wave4 = math.sin(distance_from_center * 0.4 - time_offset * 2.5) * (self.max_tier * 0.08)
-
-                # Wave 5: Fast ripple texture
-                wave5 = math.sin((r * 0.8 + c * 0.6) + time_offset * 4.0) * (self.max_tier * 0.05)
-
-                # Combine all waves with interference
-                total_height += wave1 + wave2 + wave3 + wave4 + wave5
-
-                # Add some higher frequency detail
-                detail = math.sin(r * 1.2 + c * 1.1 + time_offset * 3.0) * (self.max_tier * 0.03)
-                total_height += detail
-
-                # Clamp to valid range
-                self.heights[r][c] = max(0.0, min(float(self.max_tier), total_height))
+            # Wave 2: Vertical sine wave flowing down (per row)
+            base = median + sin((r * 0.25 + t15)) * a2
+            # Wave 5: Fast ripple texture, sin(r*0.8 + t + c*0.6) split per row
+            ripple_phase = r * 0.8 + t40
+            ripple_a = sin(ripple_phase) * a5
+            ripple_b = cos(ripple_phase) * a5
+            # Higher frequency detail, sin(r*1.2 + t + c*1.1) split per row
+            detail_phase = r * 1.2 + t30
+            detail_a = sin(detail_phase) * a6
+            detail_b = cos(detail_phase) * a6
+
+            # Combine all waves with interference and clamp to the valid range
+            # in one fused pass (no intermediate list of unclamped totals)
+            self.heights[r][:col_limit] = [
+                0.0 if (h := base + w1 + w3 + rs * radial_s + rc * radial_c
+                        + ripple_a * pc + ripple_b * ps + detail_a * dc + detail_b * ds) < 0.0
+                else ceiling if h > ceiling else h
+                for w1, w3, rs, rc, pc, ps, dc, ds in zip(
+                    wave1_cols[:col_limit], wave3_diag[r:r + col_limit],
+                    self.radial_sin[r], self.radial_cos[r],
+                    ripple_cos, ripple_sin, detail_cos, detail_sin)
+            ]
 
 
 class MorphMode(BaseAnimationMode):
@@ -135,12 +178,18 @@ class MorphMode(BaseAnimationMode):
     through complex mathematical wave interference patterns.
     """
 
+    full_cover = True  # Redraws every visible character whose color changed
+
     def __init__(self):
         super().__init__('morph')
         self.wave_field = None
         self.gradient_length = 50  # Number of color tiers
         self.base_gradient = []
         self.cached_gradient_attrs = []  # Pre-computed curses attributes
+        # Tier -> attribute lookup used by draw_frame, covering every tier
+        self._tier_attrs = (curses.A_NORMAL,) * self.gradient_length
+        self._content_bounds = None  # Per-file bounds passed to propagate_waves
+        self._shown_rows = []  # Attributes on screen for each clipped line, last frame
 
     def initialize_mode_variables(self):
         """Initialize morph-specific animation variables."""
@@ -154,9 +203,14 @@ class MorphMode(BaseAnimationMode):
 
         # Pre-compute gradient colors to curses attributes for performance
         self._precompute_gradient_attrs()
+        self._shown_rows = []
 
-        # Initialize wave field
-        self.wave_field = WaveField(len(self.lines), self.content_width, self.gradient_length - 1)
+        # Initialize wave field (re-entering the mode reuses the previous one's tables)
+        self._content_bounds = self._get_content_bounds()
+        if self.wave_field:
+            self.wave_field.resize(len(self.lines), self.content_width)
+        else:
+            self.wave_field = WaveField(len(self.lines), self.content_width, self.gradient_length - 1)
 
     def update_animation_state(self, animation_speed, update_interval):
         """Update wave field propagation simulation."""
@@ -164,20 +218,21 @@ class MorphMode(BaseAnimationMode):
             # Wave field propagation simulation with continuous time
             current_time = time.time()
 
-            # Calculate content bounds for spatial optimization
-            content_bounds = self._get_content_bounds()
-
-            self.wave_field.propagate_waves(animation_speed, current_time * animation_speed, content_bounds)
-
-    def on_resize(self):
-        """Reinitialize wave field when terminal is resized."""
-        if self.wave_field:
-            self.wave_field = WaveField(len(self.lines), self.content_width, self.gradient_length - 1)
+            # Content bounds (cached per file) for spatial optimization
+            self.wave_field.propagate_waves(animation_speed, current_time * animation_speed,
+                                            self._content_bounds)
 
     def on_file_change(self):
-        """Reinitialize wave field when file changes."""
+        """
+        Fit the wave field and content bounds to the new file.
+
+        The field is sized to the content rather than the terminal, so a
+        terminal resize leaves it untouched, and a file of the same size
+        keeps its static tables.
+        """
+        self._content_bounds = self._get_content_bounds()
         if self.wave_field:
-            self.wave_field = WaveField(len(self.lines), self.content_width, self.gradient_length - 1)
+            self.wave_field.resize(len(self.lines), self.content_width)
 
     def on_color_change(self):
         """Regenerate base gradient when color scheme changes."""
@@ -197,61 +252,44 @@ class MorphMode(BaseAnimationMode):
         if not self.color_adapter:
             return
 
-        self.cached_gradient_attrs = []
-        for rgb_color in self.base_gradient:
-            attr = self.color_adapter.get_color_attr(rgb_color, bold=True)
-            self.cached_gradient_attrs.append(attr)
+        self.cached_gradient_attrs = self.color_adapter.get_color_attrs(self.base_gradient, bold=True)
+
+        # Fixed-size tier table, so draw_frame indexes it with no range checks;
+        # tiers without a gradient color fall back to the plain attribute
+        tier_attrs = tuple(self.cached_gradient_attrs[:self.gradient_length])
+        self._tier_attrs = tier_attrs + (curses.A_NORMAL,) * (self.gradient_length - len(tier_attrs))
 
     def _get_content_bounds(self):
-        """Calculate content bounds for spatial optimization."""
-        line_lengths = []
-        for line in self.lines:
-            line_lengths.append(len(line))
+        """Calculate content bounds for spatial optimization (depends only on the file)."""
+        line_lengths = [len(line) for line in self.lines]
         return (self.content_start, self.content_end, line_lengths)
 
     def draw_frame(self):
         """Draw morph animation frame with wave field simulation."""
-        max_rows, max_cols = self.stdscr.getmaxyx()
-
-        # Draw animated text with wave field colors
-        for line_idx, line in enumerate(self.lines):
-            if line_idx + self.start_row >= max_rows:
-                break
-
-            for char_idx, char in enumerate(line):
-                # Skip whitespace characters entirely for performance
-                if not char.strip():
-                    continue
-
-                col = self.start_col + char_idx
-                row = self.start_row + line_idx
-
-                if col >= max_cols or row >= max_rows:
-                    continue
-
-                # Get tier for this character and map to color
-                if self.wave_field and char_idx < self.content_width:
-                    tier = self.wave_field.get_tier(line_idx, char_idx)
-                    if tier < len(self.cached_gradient_attrs):
-                        # Use pre-computed color attribute for performance
-                        attr = self.cached_gradient_attrs[tier]
-
-                        try:
-                            self.stdscr.addstr(row, col, char, attr)
-                        except curses.error:
-                            pass  # Ignore screen boundary errors
-                    else:
-                        # Fallback for invalid tier
-                        try:
-                            self.stdscr.addstr(row, col, char)
-                        except curses.error:
-                            pass
-                else:
-                    # Fallback if wave field not available
-                    try:
-                        self.stdscr.addstr(row, col, char)
-                    except curses.error:
-                        pass
+        wave_field = self.wave_field
+        tier_attrs = self._tier_attrs
+
+        # Slow waves leave most tiers unchanged between frames, so unless the
+        # screen was wiped only cells whose attribute changed are rewritten
+        clipped_lines = self.clipped_lines
+        shown_rows = self._shown_rows
+        if self.screen_wiped or len(shown_rows) != len(clipped_lines):
+            shown_rows = [None] * len(clipped_lines)
+
+        # Draw animated text with wave field colors (on-screen characters, clipped per layout)
+        new_rows = []
+        for (line_idx, row, line, indices), shown in zip(clipped_lines, shown_rows):
+            if wave_field:
+                # Visible characters all lie within the content width the
+                # field is sized to, and heights are clamped to valid tiers
+                heights = wave_field.heights[line_idx]
+                attrs = [tier_attrs[round(heights[char_idx])] for char_idx in indices]
+            else:
+                # Fallback if wave field not available
+                attrs = [curses.A_NORMAL] * len(indices)
+            self.draw_runs(row, line, indices, attrs, shown)
+            new_rows.append(attrs)
+        self._shown_rows = new_rows
 
 
 # Legacy function wrapper for backward compatibility
@@ -5,8 +5,8 @@ Provides ripple pulse animation with distance-based coloring using the shared
 animation framework.
 """
 
-import curses
 import math
+from array import array
 from ..animation_base import BaseAnimationMode
 
 
@@ -18,16 +18,18 @@ class PulseMode(BaseAnimationMode):
     creating waves that radiate from the center point.
     """
 
+    full_cover = True  # Redraws every visible character each frame
+
     def __init__(self):
         super().__init__('pulse')
         self.pulse_offset = 0.0
-        self.center_row = 0
-        self.center_col = 0
+        self.max_distance = 0.0
+        self._line_distances = []  # Per-line normalized distances for the current file
 
     def initialize_mode_variables(self):
         """Initialize pulse-specific animation variables."""
         self.pulse_offset = 0.0
-        self._recompute_geometry()
+        self._compute_line_distances()
 
     def update_animation_state(self, animation_speed, update_interval):
         """Update pulse animation offset."""
@@ -35,56 +37,52 @@ class PulseMode(BaseAnimationMode):
         if self.pulse_offset >= 1.0:
             self.pulse_offset -= 1.0
 
-    def on_resize(self):
-        """Update center + cached max distance when terminal is resized."""
-        self._recompute_geometry()
-
     def on_file_change(self):
-        """Update center + cached max distance when file changes."""
-        self._recompute_geometry()
+        """Recompute distances when file changes."""
+        self._compute_line_distances()
+
+    def _compute_line_distances(self):
+        """
+        Compute each visible character's normalized distance from the center.
 
-    def _recompute_geometry(self):
-        """Cache center point and max ripple distance (loop-invariant per frame)."""
-        self.center_row = self.start_row + self.content_height // 2
-        self.center_col = self.start_col + self.content_width // 2
+        Distances are measured within the content block, so they only change
+        with the file; a resize moves the block without changing any of them.
+        """
         self.max_distance = math.sqrt(self.content_width * self.content_width + self.content_height * self.content_height) / 2
+        max_distance = self.max_distance
+        sqrt = math.sqrt
+        center_line = self.content_height // 2
+        center_char = self.content_width // 2
+
+        line_distances = []
+        for line_idx, indices in enumerate(self.visible_indices):
+            dy = line_idx - center_line
+            if max_distance > 0:
+                line_distances.append(array('d', [
+                    sqrt((char_idx - center_char) * (char_idx - center_char) + dy * dy) / max_distance
+                    for char_idx in indices
+                ]))
+            else:
+                line_distances.append(array('d', bytes(8 * len(indices))))
+        self._line_distances = line_distances
 
     def draw_frame(self):
         """Draw pulse animation frame with distance-based ripples."""
-        max_rows, max_cols = self.stdscr.getmaxyx()
-
-        # Draw animated text with pulse colors
-        for line_idx, line in enumerate(self.lines):
-            if line_idx + self.start_row >= max_rows:
-                break
-
-            for char_idx, char in enumerate(line):
-                # Skip whitespace characters entirely for performance
-                if not char.strip():
-                    continue
-
-                col = self.start_col + char_idx
-                row = self.start_row + line_idx
-
-                if col >= max_cols or row >= max_rows:
-                    continue
-
-                # Calculate distance from center
-                dy = row - self.center_row
-                dx = col - self.center_col
-                distance = math.sqrt(dx * dx + dy * dy)
-
-                # Normalize distance to 0-1 range and subtract pulse offset for outward pulse
-                normalized_distance = distance / self.max_distance if self.max_distance > 0 else 0
-                color_position = (normalized_distance - self.pulse_offset) % 1.0
-
-                # Get color from pre-computed palette (optimized)
-                attr = self.get_color_from_palette(color_position)
-
-                try:
-                    self.stdscr.addstr(row, col, char, attr)
-                except curses.error:
-                    pass  # Ignore screen boundary errors
+        # Palette LUT indexed inline (get_color_from_palette without the call);
+        # a one-entry (A_BOLD,) table stands in before the palette is built
+        palette = self.color_palette or (1,)
+        scale = self._palette_len_m1 if self.color_palette else 0
+
+        pulse_offset = self.pulse_offset
+        line_distances = self._line_distances
+
+        # Draw animated text with pulse colors (on-screen characters, clipped per layout)
+        for line_idx, row, line, indices in self.clipped_lines:
+            # Subtract pulse offset from the precomputed distances for outward pulse;
+            # clipped indices are a prefix of the line's, so zip pairs them up
+            attrs = [palette[int(((distance - pulse_offset) % 1.0) * scale)]
+                     for _, distance in zip(indices, line_distances[line_idx])]
+            self.draw_runs(row, line, indices, attrs)
 
 
 # Legacy function wrapper for backward compatibility
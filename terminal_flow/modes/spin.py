@@ -5,9 +5,9 @@ Provides polar coordinate rotation animation using the shared
 animation framework.
 """
 
-import curses
 import math
-from ..animation_base import BaseAnimationMode
+from array import array
+from ..animation_base import BaseAnimationMode, make_gather
 
 
 class SpinMode(BaseAnimationMode):
@@ -18,71 +18,109 @@ class SpinMode(BaseAnimationMode):
     for smooth circular color transitions.
     """
 
+    full_cover = True  # Redraws every visible character whose color changed
+
     def __init__(self):
         super().__init__('spin')
-        self.rotation_angle = 0.0
-        self.center_row = 0
-        self.center_col = 0
+        self.rotation_pos = 0.0  # Fraction of a full turn, kept in [0, 1)
+        # Base positions (palette steps) of the visible characters, in draw order
+        self._spin_bases = array('H')
+        self._spin_spans = []  # (row, line, indices, start, end) slices of the bases per line
+        self._spin_gather = tuple  # Picks each character's entry from a rotated ring
+        self._line_angles = []  # Per-line angle arrays for the current file
+        self._spin_shown = []  # Attribute currently on screen for each character
+        self._shown_tick = None  # Rotation step the on-screen frame was drawn at
 
     def initialize_mode_variables(self):
         """Initialize spin-specific animation variables."""
-        self.rotation_angle = 0.0
-        self.center_row = self.start_row + self.content_height // 2
-        self.center_col = self.start_col + self.content_width // 2
+        self.rotation_pos = 0.0
+        self._spin_shown = []
+        self._shown_tick = None
+        self._compute_line_angles()
+        self._rebuild_spin_layout()
+
+    def _compute_line_angles(self):
+        """
+        Compute each visible character's angle around the content center,
+        quantized to palette steps.
+
+        Angles are taken relative to the content block, not the screen, so they
+        only change with the file: a resize re-centers the block but leaves
+        every character's offset from its center (and thus its angle) intact.
+        """
+        steps = self.palette_size - 1
+        scale = steps / math.tau
+        atan2 = math.atan2
+        center_line = self.content_height // 2
+        center_char = self.content_width // 2
+        self._line_angles = [
+            array('H', [int((atan2(line_idx - center_line, char_idx - center_char) * scale) % steps)
+                        for char_idx in indices])
+            for line_idx, indices in enumerate(self.visible_indices)
+        ]
+
+    def _rebuild_spin_layout(self):
+        """
+        Gather the on-screen characters and their base color positions.
+
+        Base color positions come from the per-file angle table, so a resize
+        only re-clips the layout instead of running atan2 again.
+        """
+        line_angles = self._line_angles
+        spans, bases = [], array('H')
+        for line_idx, row, line, indices in self.clipped_lines:
+            start = len(bases)
+            bases.extend(line_angles[line_idx][:len(indices)])
+            spans.append((row, line, indices, start, len(bases)))
+
+        self._spin_spans = spans
+        self._spin_bases = bases
+        # One gather resolves the whole frame's attributes in C
+        self._spin_gather = make_gather(bases)
 
     def update_animation_state(self, animation_speed, update_interval):
-        """Update rotation angle."""
-        self.rotation_angle += animation_speed * update_interval * math.pi  # Rotate in radians
-        if self.rotation_angle >= 2 * math.pi:
-            self.rotation_angle -= 2 * math.pi
+        """Advance rotation by half a turn per second at speed 1.0."""
+        self.rotation_pos = (self.rotation_pos + animation_speed * update_interval * 0.5) % 1.0
 
     def on_resize(self):
-        """Update center point when terminal is resized."""
-        self.center_row = self.start_row + self.content_height // 2
-        self.center_col = self.start_col + self.content_width // 2
+        """Rebuild the layout when terminal is resized."""
+        self._rebuild_spin_layout()
 
     def on_file_change(self):
-        """Update center point when file changes."""
-        self.center_row = self.start_row + self.content_height // 2
-        self.center_col = self.start_col + self.content_width // 2
+        """Recompute angles and layout when file changes."""
+        self._compute_line_angles()
+        self._rebuild_spin_layout()
 
     def draw_frame(self):
         """Draw spin animation frame with polar coordinates."""
-        max_rows, max_cols = self.stdscr.getmaxyx()
-
-        # Draw animated text with spin colors
-        for line_idx, line in enumerate(self.lines):
-            if line_idx + self.start_row >= max_rows:
-                break
-
-            for char_idx, char in enumerate(line):
-                # Skip whitespace characters entirely for performance
-                if not char.strip():
-                    continue
-
-                col = self.start_col + char_idx
-                row = self.start_row + line_idx
-
-                if col >= max_cols or row >= max_rows:
-                    continue
-
-                # Calculate polar coordinates from center
-                dy = row - self.center_row
-                dx = col - self.center_col
-
-                # Calculate angle from center (0 to 2π)
-                angle = math.atan2(dy, dx)
-
-                # Normalize angle to 0-1 range and add rotation
-                color_position = ((angle + self.rotation_angle) / (2 * math.pi)) % 1.0
-
-                # Get color from pre-computed palette (optimized)
-                attr = self.get_color_from_palette(color_position)
-
-                try:
-                    self.stdscr.addstr(row, col, char, attr)
-                except curses.error:
-                    pass  # Ignore screen boundary errors
+        # Rotation in whole palette steps, added to each character's base step
+        steps = self.palette_size - 1
+        tick = int(self.rotation_pos * steps)
+
+        # Same step onto an intact screen: the displayed frame is already current
+        if tick == self._shown_tick and not self.screen_wiped:
+            return
+        self._shown_tick = tick
+
+        # Rotate the ring by slicing it at tick, then gather every character's
+        # attribute in a single C call before issuing the writes
+        if self.color_palette:
+            attrs = self._spin_gather(self.palette_ring()[tick:tick + steps])
+        else:
+            attrs = [self.get_color_from_palette(0.0)] * len(self._spin_bases)
+
+        # Unless the screen was wiped or the layout changed, only cells whose
+        # color changed are rewritten
+        shown = self._spin_shown
+        if self.screen_wiped or len(shown) != len(attrs):
+            shown = None
+
+        draw_runs = self.draw_runs
+        for row, line, indices, start, end in self._spin_spans:
+            draw_runs(row, line, indices, attrs[start:end],
+                      None if shown is None else shown[start:end])
+
+        self._spin_shown = attrs
 
 
 # Legacy function wrapper for backward compatibility
@@ -5,9 +5,9 @@ Provides horizontal wave animation with gradient support using the shared
 animation framework.
 """
 
-import curses
+from array import array
 
-from ..animation_base import BaseAnimationMode
+from ..animation_base import BaseAnimationMode, make_gather
 
 
 class WaveMode(BaseAnimationMode):
@@ -18,13 +18,19 @@ class WaveMode(BaseAnimationMode):
     with customizable speed and color schemes.
     """
 
+    full_cover = True  # Redraws every visible character each frame
+
     def __init__(self):
         super().__init__('wave')
         self.animation_offset = 0.0
+        self._line_steps = []  # Per-line base palette steps for the current file
+        self._wave_rows = []  # (row, line, indices, gather) for each on-screen line
 
     def initialize_mode_variables(self):
         """Initialize wave-specific animation variables."""
         self.animation_offset = 0.0
+        self._compute_line_steps()
+        self._rebuild_wave_layout()
 
     def update_animation_state(self, animation_speed, update_interval):
         """Update wave animation offset."""
@@ -32,40 +38,54 @@ class WaveMode(BaseAnimationMode):
         if self.animation_offset >= 1.0:
             self.animation_offset -= 1.0
 
+    def on_resize(self):
+        """Re-clip the layout when terminal is resized."""
+        self._rebuild_wave_layout()
+
+    def on_file_change(self):
+        """Recompute base steps and layout when file changes."""
+        self._compute_line_steps()
+        self._rebuild_wave_layout()
+
+    def _compute_line_steps(self):
+        """
+        Compute each visible character's base color position in palette steps.
+
+        A character's position within its line plus the per-line phase only
+        changes with the file; each frame then just adds the wave offset.
+        """
+        steps = self.palette_size - 1
+        self._line_steps = [
+            array('H', [int(((line_positions[char_idx] + line_idx * 0.1) % 1.0) * steps) % steps
+                        for char_idx in indices])
+            for line_idx, (line_positions, indices) in enumerate(zip(self.char_positions,
+                                                                     self.visible_indices))
+        ]
+
+    def _rebuild_wave_layout(self):
+        """Pair each on-screen line with a gather over its characters' base steps."""
+        line_steps = self._line_steps
+        self._wave_rows = [
+            (row, line, indices, make_gather(line_steps[line_idx][:len(indices)]))
+            for line_idx, row, line, indices in self.clipped_lines
+        ]
+
     def draw_frame(self):
         """Draw wave animation frame."""
-        max_rows, max_cols = self.stdscr.getmaxyx()
-
-        # Draw animated text
-        for line_idx, line in enumerate(self.lines):
-            if line_idx + self.start_row >= max_rows:
-                break
-
-            # Per-line invariants, hoisted out of the inner char loop (output-identical)
-            line_len = len(line)
-            line_phase = line_idx * 0.1
-
-            for char_idx, char in enumerate(line):
-                # Skip whitespace characters entirely for performance
-                if not char.strip():
-                    continue
-
-                col = self.start_col + char_idx
-                row = self.start_row + line_idx
-
-                if col >= max_cols or row >= max_rows:
-                    continue
-
-                # Calculate color position for this character (per-character calculation)
-                position = (char_idx / line_len + self.animation_offset + line_phase) % 1.0
-
-                # Get color from pre-computed palette (optimized)
-                attr = self.get_color_from_palette(position)
-
-                try:
-                    self.stdscr.addstr(row, col, char, attr)
-                except curses.error:
-                    pass  # Ignore screen boundary errors
+        # Wave offset in whole palette steps; rotating the ring by it shifts
+        # every character's color at once, without per-character float math
+        if self.color_palette:
+            steps = self.palette_size - 1
+            tick = int(self.animation_offset * steps)
+            rotated = self.palette_ring()[tick:tick + steps]
+        else:
+            rotated = None
+
+        # Draw animated text (on-screen non-whitespace characters, clipped per layout)
+        for row, line, indices, gather in self._wave_rows:
+            # Without a palette yet, fall back to plain bold (get_color_from_palette's default)
+            attrs = gather(rotated) if rotated is not None else (1,) * len(indices)
+            self.draw_runs(row, line, indices, attrs)
 
 
 # Legacy function wrapper for backward compatibility
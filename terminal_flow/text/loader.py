@@ -5,8 +5,9 @@ Provides file discovery, loading, and validation functionality for terminal-flow
 ASCII art animations.
 """
 
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 class TextLoader:
@@ -15,7 +16,7 @@ class TextLoader:
 
     Features:
         - Automatic .txt file discovery in specified directories
-        - File content loading and validation
+        - File content loading and validation, cached until a file's mtime changes
         - Support for empty directory initialization (for direct file path usage)
         - File counting and enumeration
 
@@ -35,6 +36,7 @@ class TextLoader:
         """
         self.text_dir = Path(text_dir) if text_dir else None
         self._file_count = 0
+        self._content_cache: Dict[str, Tuple[int, str]] = {}  # path -> (mtime_ns, content)
 
     def discover_files(self) -> List[Path]:
         """
@@ -50,11 +52,14 @@ class TextLoader:
         if not self.text_dir:
             raise ValueError("Cannot discover files without a text directory")
 
-        if not self.text_dir.exists():
-            raise FileNotFoundError(f"Text directory not found: {self.text_dir}")
-
-        # Find all .txt files in the directory
-        txt_files = list(self.text_dir.glob("*.txt"))
+        # Find all .txt files in the directory; scandir's entries carry their
+        # names and file types, so no per-entry stat or Path is needed to filter
+        try:
+            with os.scandir(self.text_dir) as entries:
+                txt_files = [Path(entry.path) for entry in entries
+                             if entry.name.endswith('.txt') and entry.is_file()]
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Text directory not found: {self.text_dir}") from None
         txt_files.sort()  # Sort for consistent ordering
 
         self._file_count = len(txt_files)
@@ -64,6 +69,10 @@ class TextLoader:
         """
         Load content from a text file.
 
+        Contents are cached per path until the file's mtime changes, so cycling
+        back to a file (or sharing this loader between animation modes) costs a
+        stat instead of a read and decode, while edited files are picked up.
+
         Args:
             file_path: Path to the .txt file to load
 
@@ -74,14 +83,22 @@ class TextLoader:
             FileNotFoundError: If the file doesn't exist
             IOError: If the file cannot be read
         """
-        file_path = Path(file_path)  # Ensure it's a Path object
+        # Plain string key: equal paths hit the same entry whether given as str or Path
+        key = os.fspath(file_path)
+
+        try:
+            mtime_ns = os.stat(key).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Text file not found: {file_path}") from None
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"Text file not found: {file_path}")
+        cached = self._content_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
+            with open(key, 'r', encoding='utf-8') as f:
                 content = f.read()
+            self._content_cache[key] = (mtime_ns, content)
             return content
         except IOError as e:
             raise IOError(f"Failed to read file {file_path}: {e}")
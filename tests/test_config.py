@@ -0,0 +1,51 @@
+"""Tests for loading color configuration and building schemes from it."""
+
+import pytest
+
+from terminal_flow.colors.config import ColorConfig, ColorSchemeLoader
+from terminal_flow.colors.schemes import CustomColors
+
+
+def test_custom_scheme_instances_are_shared():
+    loader = ColorSchemeLoader()
+    config = ColorConfig(scheme_type='custom', colors=['#ff0000', [0, 0, 255]])
+    scheme = loader.create_color_scheme(config)
+    assert isinstance(scheme, CustomColors)
+    assert loader.create_color_scheme(config) is scheme
+
+
+@pytest.mark.parametrize('colors', [
+    ['#ff0000', {'r': 0, 'g': 0, 'b': 255}],
+    ['#ff0000', [[0, 0, 255]]],
+])
+def test_unhashable_custom_colors_raise_value_error(colors):
+    loader = ColorSchemeLoader()
+    with pytest.raises(ValueError):
+        loader.create_color_scheme(ColorConfig(scheme_type='custom', colors=colors))
+
+
+def write_config(tmp_path, data):
+    path = tmp_path / 'config.json'
+    path.write_bytes(data)
+    return path
+
+
+def test_utf8_config_loads(tmp_path):
+    path = write_config(tmp_path, '{"colors": {"scheme_type": "prism", "saturation": 0.5}}'.encode('utf-8'))
+    config = ColorSchemeLoader().load_from_file(path)
+    assert config.scheme_type == 'prism'
+    assert config.saturation == 0.5
+
+
+def test_bom_prefixed_config_is_invalid_json(tmp_path):
+    # Decoded as plain UTF-8, the BOM is a stray character before the JSON
+    path = write_config(tmp_path, b'\xef\xbb\xbf{"colors": {}}')
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        ColorSchemeLoader().load_from_file(path)
+
+
+@pytest.mark.parametrize('encoding', ['utf-16', 'utf-32'])
+def test_non_utf8_config_fails_to_decode(tmp_path, encoding):
+    path = write_config(tmp_path, '{"colors": {}}'.encode(encoding))
+    with pytest.raises(UnicodeDecodeError):
+        ColorSchemeLoader().load_from_file(path)
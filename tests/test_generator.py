@@ -0,0 +1,16 @@
+"""Tests for ColorGenerator conversions."""
+
+import pytest
+
+from terminal_flow.colors.generator import ColorGenerator
+
+
+def test_rgb_to_hex_formats_every_channel_value():
+    for value in range(256):
+        assert ColorGenerator.rgb_to_hex((value, 0, 255 - value)) == f"#{value:02x}00{255 - value:02x}"
+
+
+@pytest.mark.parametrize('rgb', [(-1, 0, 0), (0, 256, 0), (0, 0, -255), (300, 300, 300)])
+def test_rgb_to_hex_rejects_out_of_range_channels(rgb):
+    with pytest.raises(ValueError, match="0-255"):
+        ColorGenerator.rgb_to_hex(rgb)
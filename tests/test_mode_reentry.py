@@ -0,0 +1,114 @@
+"""
+Tests for re-entering an animation mode after switching through the others.
+
+Mode instances are reused across switches (see curses_main), so a mode that
+only redraws changed cells must not trust what it drew during an earlier run.
+"""
+
+import curses
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from terminal_flow.colors import curses_adapter
+from terminal_flow.modes.flux import FluxMode
+from terminal_flow.modes.morph import MorphMode
+from terminal_flow.modes.pulse import PulseMode
+from terminal_flow.modes.spin import SpinMode
+from terminal_flow.modes.wave import WaveMode
+from terminal_flow.text import TextLoader
+
+TEXT_DIR = Path(__file__).resolve().parent.parent / 'terminal_flow' / 'text'
+
+MODE_CLASSES = {
+    'wave': WaveMode,
+    'spin': SpinMode,
+    'pulse': PulseMode,
+    'flux': FluxMode,
+    'morph': MorphMode,
+}
+
+FRAMES_PER_RUN = 3
+UPDATE_INTERVAL = 0.001
+
+
+class FakeScreen:
+    """Minimal stand-in for a curses window that records every written cell."""
+
+    def __init__(self, keys=()):
+        self.cells = {}
+        self.keys = list(keys)
+
+    def getmaxyx(self):
+        return (40, 120)
+
+    def addstr(self, row, col, text, attr=0):
+        for i, char in enumerate(text):
+            self.cells[(row, col + i)] = (char, attr)
+
+    def erase(self):
+        self.cells.clear()
+
+    def getch(self):
+        return self.keys.pop(0) if self.keys else ord('q')
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+@pytest.fixture
+def text_files():
+    return TextLoader(str(TEXT_DIR)).discover_files()
+
+
+@pytest.fixture(autouse=True)
+def fake_curses(monkeypatch):
+    """Patch the curses calls made outside of a window, with 256 colors available."""
+    monkeypatch.setattr(curses, 'curs_set', lambda visibility: None, raising=False)
+    monkeypatch.setattr(curses, 'doupdate', lambda: None, raising=False)
+    monkeypatch.setattr(curses, 'color_pair', lambda pair: pair << 8, raising=False)
+    monkeypatch.setattr(curses, 'has_colors', lambda: True, raising=False)
+    monkeypatch.setattr(curses, 'start_color', lambda: None, raising=False)
+    monkeypatch.setattr(curses, 'can_change_color', lambda: False, raising=False)
+    monkeypatch.setattr(curses, 'init_pair', lambda pair, fg, bg: None, raising=False)
+    monkeypatch.setattr(curses, 'COLORS', 256, raising=False)
+    monkeypatch.setattr(curses, 'COLOR_PAIRS', 256, raising=False)
+    monkeypatch.setattr(curses_adapter, '_default_adapter', None)
+    monkeypatch.setattr(curses_adapter, '_default_sequence', None)
+
+
+def run_mode(mode, screen, text_files, keys):
+    """Run one mode on the screen until the scripted keys are used up."""
+    screen.keys = list(keys)
+    return mode.run(screen, text_files, animation_speed=1.0, update_interval=UPDATE_INTERVAL,
+                    cycle_interval=0, color_scheme=None, starting_file_index=2)
+
+
+def fresh_render(mode_name, text_files):
+    """Render a mode's first frames onto a blank screen, as a first run would."""
+    screen = FakeScreen()
+    run_mode(MODE_CLASSES[mode_name](), screen, text_files, [-1] * FRAMES_PER_RUN)
+    return screen.cells
+
+
+@pytest.mark.parametrize('mode_name', ['spin', 'flux', 'morph'])
+def test_reentered_mode_repaints_screen(mode_name, text_files):
+    """Cycling through every mode and back leaves none of the other modes' colors."""
+    # Morph colors depend on the wall clock; freeze it so renders are comparable
+    with mock.patch('terminal_flow.modes.morph.time.time', return_value=1000.0):
+        expected = fresh_render(mode_name, text_files)
+
+        instances = {name: cls() for name, cls in MODE_CLASSES.items()}
+        screen = FakeScreen()
+        current = mode_name
+        for _ in range(len(MODE_CLASSES)):
+            result = run_mode(instances[current], screen, text_files,
+                              [-1] * FRAMES_PER_RUN + [ord('m')])
+            current = result['next_mode']
+        assert current == mode_name
+
+        run_mode(instances[mode_name], screen, text_files, [-1] * FRAMES_PER_RUN)
+
+    assert expected
+    assert screen.cells == expected
@@ -0,0 +1,192 @@
+"""
+Tests for the integer palette, hue and gradient math in terminal_flow.colors.
+
+Each fast path is checked against the float formula it replaced. The float
+formulas can land a hair below a palette boundary through rounding, so at
+those points the exact rational value decides instead.
+"""
+
+import math
+import random
+from fractions import Fraction
+
+import pytest
+
+from terminal_flow.colors.animator import ColorAnimator
+from terminal_flow.colors.generator import (
+    _HUE_STEPS,
+    _MONO_GRADIENTS,
+    ColorGenerator,
+    _palette_indices,
+)
+from terminal_flow.colors.schemes import CustomColors
+
+LENGTHS = [1, 2, 3, 7, 10, 33, 50, 100, 333]
+PALETTE_LENGTHS = [2, 27, 30, 45, 90, _HUE_STEPS]
+
+_rng = random.Random(1)
+OFFSETS = ([k / 100 for k in range(100)]
+           + [_rng.random() for _ in range(60)]
+           + [0.999, 0.9999999, 1 / 3, 2 / 3])
+
+# Float results this close to an integer may have been rounded across it
+_BOUNDARY_EPS = 1e-9
+
+
+def near_integer(value):
+    return abs(value - round(value)) < _BOUNDARY_EPS
+
+
+def float_palette_index(i, length, offset, palette_length):
+    """Palette index the pre-integer code computed, and the float it floored."""
+    position = (i / length + offset) * palette_length
+    return int(position) % palette_length, position
+
+
+def exact_palette_index(i, length, offset, palette_length):
+    """floor((i / length + offset) * palette_length) in exact rational arithmetic."""
+    return math.floor((Fraction(i, length) + Fraction(offset)) * palette_length) % palette_length
+
+
+@pytest.mark.parametrize('palette_length', PALETTE_LENGTHS)
+@pytest.mark.parametrize('length', LENGTHS)
+def test_palette_indices_match_float_formula(length, palette_length):
+    for offset in OFFSETS:
+        indices = _palette_indices(length, offset, palette_length)
+        assert len(indices) == length
+        for i, index in enumerate(indices):
+            expected, position = float_palette_index(i, length, offset, palette_length)
+            if index != expected:
+                assert near_integer(position), (length, palette_length, offset, i)
+            assert index == exact_palette_index(i, length, offset, palette_length)
+
+
+def test_palette_indices_hue_formula_near_wraparound():
+    # The rainbow path wrapped the position into [0, 1) before scaling
+    for length in LENGTHS:
+        for offset in (0.999, 0.9999, 0.99999999, 1 - 2 ** -40):
+            for i, index in enumerate(_palette_indices(length, offset, _HUE_STEPS)):
+                position = ((i / length + offset) % 1.0) * _HUE_STEPS
+                if index != int(position):
+                    assert near_integer(position)
+                assert index == exact_palette_index(i, length, offset, _HUE_STEPS)
+
+
+def test_palette_indices_negative_and_large_offsets():
+    for length in (1, 3, 10):
+        for offset in (-0.25, -1.75, 1.5, 3.0):
+            assert _palette_indices(length, offset, 10) == [
+                exact_palette_index(i, length, offset, 10) for i in range(length)]
+
+
+def float_gradient(start_color, end_color, steps):
+    """Gradient as interpolate_colors built it, one float factor per step."""
+    return [ColorGenerator.interpolate_colors(start_color, end_color, i / (steps - 1))
+            for i in range(steps)]
+
+
+def test_gradient_colors_match_float_interpolation():
+    rng = random.Random(2)
+    for _ in range(300):
+        start_color = tuple(rng.randrange(256) for _ in range(3))
+        end_color = tuple(rng.randrange(256) for _ in range(3))
+        steps = rng.randrange(2, 60)
+        gradient = ColorGenerator.generate_gradient_colors(start_color, end_color, steps)
+        assert len(gradient) == steps
+        assert gradient[0] == start_color
+        assert gradient[-1] == end_color
+        for i, (color, expected) in enumerate(zip(gradient, float_gradient(start_color, end_color, steps))):
+            for channel in range(3):
+                start, end = start_color[channel], end_color[channel]
+                exact = start + Fraction((end - start) * i, steps - 1)
+                assert color[channel] == math.floor(exact)
+                if color[channel] != expected[channel]:
+                    assert near_integer(start + (end - start) * (i / (steps - 1)))
+
+
+def test_gradient_colors_short_request():
+    assert ColorGenerator.generate_gradient_colors((1, 2, 3), (4, 5, 6), 1) == [(1, 2, 3), (4, 5, 6)]
+
+
+@pytest.mark.parametrize('length', [1, 7, 50])
+def test_packed_rainbow_matches_tuple_and_hex_forms(length):
+    for offset in (0.0, 0.37, 0.999):
+        colors = ColorGenerator.generate_rainbow_sequence(length, 0.75, 0.9, offset)
+        packed = ColorGenerator.generate_rainbow_sequence_packed(length, 0.75, 0.9, offset)
+        hex_colors = ColorGenerator.generate_rainbow_sequence_hex(length, 0.75, 0.9, offset)
+        assert packed == bytes(channel for color in colors for channel in color)
+        assert hex_colors == [ColorGenerator.rgb_to_hex(color) for color in colors]
+
+
+def test_rainbow_sequence_within_one_level_of_hsv():
+    for length in (1, 7, 50):
+        for offset in (0.0, 0.37, 0.999):
+            colors = ColorGenerator.generate_rainbow_sequence(length, 1.0, 1.0, offset)
+            for i, color in enumerate(colors):
+                expected = ColorGenerator.hsv_to_rgb((i / length + offset) % 1.0, 1.0, 1.0)
+                assert all(abs(a - b) <= 1 for a, b in zip(color, expected)), (length, offset, i)
+
+
+def test_animator_packed_frames_match_float_formula():
+    anchors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    # The palette as the float code built it: 10-step gradients between neighbours
+    palette = []
+    for i, start_color in enumerate(anchors):
+        palette.extend(float_gradient(start_color, anchors[(i + 1) % len(anchors)], 10)[:-1])
+
+    animator = ColorAnimator(CustomColors(anchors), fps=30, enable_cache=False)
+    length = 40
+    offset_step = 1.0 * 0.5 / 30
+    frames = animator.pre_calculate_frames(length, animation_speed=1.0)
+    for frame_idx, frame in enumerate(frames):
+        offset = (frame_idx * offset_step) % 1.0
+        expected = bytearray()
+        for i in range(length):
+            index, position = float_palette_index(i, length, offset, len(palette))
+            if near_integer(position):
+                index = exact_palette_index(i, length, offset, len(palette))
+            expected.extend(palette[index])
+        assert frame == bytes(expected), frame_idx
+
+
+def expected_palette_walk(palette, length, offset):
+    """Colors the float code picked from a cyclic palette, boundary cases taken exactly."""
+    colors = []
+    for i in range(length):
+        index, position = float_palette_index(i, length, offset, len(palette))
+        if near_integer(position):
+            index = exact_palette_index(i, length, offset, len(palette))
+        colors.append(palette[index])
+    return colors
+
+
+def test_custom_colors_match_float_formula():
+    scheme = CustomColors(['#ff0000', '#00ff00', (0, 0, 255)])
+    anchors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    palette = []
+    for i, start_color in enumerate(anchors):
+        palette.extend(ColorGenerator.generate_gradient_colors(
+            start_color, anchors[(i + 1) % len(anchors)], 10)[:-1])
+
+    # Just below a full turn: the last palette entry, not a wrap back to the first
+    assert scheme.get_colors_for_text(1, 0.999) == [palette[-1]]
+
+    for length in (1, 2, 7, 40, 333):
+        for offset in OFFSETS:
+            expected = expected_palette_walk(palette, length, offset)
+            assert scheme.get_colors_for_text(length, offset) == expected, (length, offset)
+            assert scheme.get_colors_packed(length, offset) == bytes(
+                channel for color in expected for channel in color)
+
+
+def test_monochromatic_gradient_matches_float_formula():
+    anchors = _MONO_GRADIENTS['blue']
+    for length in (1, 2, 7, 40, 333):
+        steps = max(10, length // 2)
+        palette = []
+        for i in range(len(anchors) - 1):
+            segment = ColorGenerator.generate_gradient_colors(anchors[i], anchors[i + 1], steps)
+            palette.extend(segment if i == 0 else segment[1:])
+        for offset in OFFSETS:
+            assert (ColorGenerator.generate_monochromatic_gradient('blue', length, offset)
+                    == expected_palette_walk(palette, length, offset)), (length, offset)